@@ -7,21 +7,60 @@ Application Streamlit avec design professionnel et image de fond personnalisée
 # IMPORTS OPTIMISÉS
 # ============================================
 import streamlit as st
-import pandas as pd
-import numpy as np
-import plotly.graph_objects as go
-import plotly.express as px
 from datetime import datetime
 from pathlib import Path
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+import atexit
 import base64
+import functools
+import gzip
+import hashlib
+import importlib
+import io
+import itertools
 import json
+import logging
 import sys
 import os
-from typing import Dict, List, Optional, Tuple
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 # Configuration du path
 sys.path.append(str(Path(__file__).parent))
 
+# ============================================
+# IMPORTS PARESSEUX (démarrage rapide)
+# ============================================
+class LazyModule:
+    """Module importé au premier accès à l'un de ses attributs.
+
+    Les dépendances lourdes ne coûtent rien au démarrage ni aux reruns qui
+    ne s'en servent pas ; une fois importées, elles restent dans sys.modules.
+    """
+
+    def __init__(self, name: str):
+        self._name = name
+
+    def __getattr__(self, attr: str):
+        return getattr(importlib.import_module(self._name), attr)
+
+    def __repr__(self) -> str:
+        return f"<LazyModule {self._name!r}>"
+
+pd = LazyModule("pandas")
+np = LazyModule("numpy")
+go = LazyModule("plotly.graph_objects")
+px = LazyModule("plotly.express")
+Image = LazyModule("PIL.Image")
+ImageOps = LazyModule("PIL.ImageOps")
+
 # ============================================
 # CONFIGURATION & CONSTANTES
 # ============================================
@@ -37,10 +76,24 @@ class Config:
     BASE_DIR = Path(__file__).parent
     ASSETS_DIR = BASE_DIR / "assets"
     IMAGES_DIR = ASSETS_DIR / "images"
+    ICONS_DIR = IMAGES_DIR / "icons"  # Sprite des logos (scripts/build_icons.py)
+    ICON_CELL = 80  # Taille d'une case du sprite (px), 2x la plus grande icône affichée
+    PROFILE_PHOTO_WIDTH = 200  # Largeur affichée (px) ; dérivés générés en 1x et 2x
+    PROFILE_PHOTO_QUALITY = 85  # Qualité WebP des dérivés de la photo
     DATA_DIR = ASSETS_DIR / "data"
+    INDEX_DIR = ASSETS_DIR / "index"  # Index de recherche persisté (généré)
+    
+    # Fichiers générés, servis par Streamlit (server.enableStaticServing)
+    # ou par scripts/serve_static.py (PORTFOLIO_STATIC_URL=http://hôte:8502)
+    STATIC_DIR = BASE_DIR / "static"
+    STATIC_URL = os.environ.get("PORTFOLIO_STATIC_URL", "app/static")
+    STATIC_SERVING = None  # None : suit l'option server.enableStaticServing (toujours vrai si STATIC_URL est absolue)
+    STATIC_COMPRESSIBLE = (".css", ".js", ".json", ".svg", ".html")  # Variantes .gz/.br pré-calculées
     
     # Background image (l'image que vous avez fournie)
     BACKGROUND_IMAGE = BASE_DIR / "image de fond.png"
+    BACKGROUND_WIDTHS = (960, 1920)  # Variantes WebP générées (px)
+    BACKGROUND_QUALITY = 70
     
     # Design
     COLORS = {
@@ -49,177 +102,1065 @@ class Config:
         "accent": "#00d4ff",   # Bleu data science
         "dark": "#0a0a0a",
         "light": "#e0e0e0",
-        "overlay": "rgba(10, 10, 10, 0.85)"  # Overlay plus foncé
+        "overlay": "rgba(10, 10, 10, 0.85)",  # Overlay plus foncé
+        "panel": "#0f172a"  # Fond des cartes (décliné en transparences)
     }
     
+    # Données (un fichier <nom>.json par jeu de données dans DATA_DIR)
+    DATA_FILES = ("profile", "projects", "research", "skills", "experience")
+    
+    # Budgets de démarrage (scripts/startup_bench.py)
+    IMPORT_BUDGET_MS = 1000
+    FIRST_RENDER_BUDGET_MS = 4000
+    
     # Performance
-    CACHE_TTL = 3600  # 1 heure
+    PROJECTS_PAGE_SIZE = 10
+    STREAM_BATCH_SIZE = 20  # Cartes émises par lot (expériences, publications) ; 0 = tout d'un bloc
+    SEARCH_MAX_RESULTS = 20
+    FRAGMENT_CACHE_MAX_ITEMS = 512
+    FRAGMENT_CACHE_MAX_BYTES = 8 * 1024 * 1024  # 8 Mo de HTML pré-rendu
+    IMAGE_CACHE_MAX_ITEMS = 64
+    IMAGE_CACHE_MAX_BYTES = 4 * 1024 * 1024  # Dérivés d'images gardés en mémoire
+    
+    # Cache partagé entre processus et réplicas : "none", "disk" (SQLite) ou "redis"
+    CACHE_BACKEND = os.environ.get("PORTFOLIO_CACHE_BACKEND", "none")
+    CACHE_URL = os.environ.get("PORTFOLIO_CACHE_URL", "redis://localhost:6379/0")
+    CACHE_DIR = BASE_DIR / ".cache"
+    SHARED_CACHE_MAX_BYTES = 256 * 1024 * 1024
+    SHARED_CACHE_LOCK_TTL = 30  # Durée max (s) d'un calcul avant reprise par un autre processus
+    SHARED_CACHE_TIMEOUT = 1.0  # Délai réseau max (s) d'un appel Redis avant repli sur le calcul local
+    # Version du code : invalide les fragments HTML partagés à chaque déploiement
+    BUILD_ID = os.environ.get("PORTFOLIO_BUILD_ID") or hashlib.sha256(Path(__file__).read_bytes()).hexdigest()[:12]
+    
+    # Instrumentation (désactivée par défaut : aucun surcoût)
+    METRICS_ENABLED = os.environ.get("PORTFOLIO_METRICS", "0") == "1"
+    METRICS_LOG_INTERVAL = 60  # Secondes entre deux journaux JSON des métriques
+    # Export texte Prometheus (optionnel) : un fichier par processus, <nom>.<pid><suffixe>
+    # (cf. metrics_file), fusionnés par scripts/serve_static.py sur /metrics
+    METRICS_FILE = os.environ.get("PORTFOLIO_METRICS_FILE")
 
 # ============================================
-# GESTION DU CACHE (Performance)
+# INSTRUMENTATION (métriques)
 # ============================================
-@st.cache_data(ttl=Config.CACHE_TTL)
-def load_profile_data() -> Dict:
-    """Charge les données du profil avec cache"""
+logger = logging.getLogger("portfolio.metrics")
+_current_span: ContextVar[str] = ContextVar("current_span", default="page")
+
+def metrics_file(pid: int) -> Path:
+    """Fichier Prometheus du processus `pid` : chaque worker écrit le sien (portfolio.prom -> portfolio.<pid>.prom)"""
+    path = Path(Config.METRICS_FILE)
+    return path.with_name(f"{path.stem}.{pid}{path.suffix}")
+
+class Metrics:
+    """Durées, compteurs de cache et volumes émis, agrégés pour tout le processus"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.spans: Dict[str, List[float]] = {}  # nom -> [nombre, total (s), max (s)]
+        self.cache: Dict[str, List[int]] = {}  # cache -> [hits, misses]
+        self.payload: Dict[str, int] = {}  # span -> octets émis
+        self.last_flush = time.monotonic()
+        # Sans handler, les journaux INFO seraient filtrés (niveau WARNING par défaut)
+        if not logger.handlers:
+            handler = logging.StreamHandler()
+            handler.setFormatter(logging.Formatter("%(asctime)s %(name)s %(message)s"))
+            logger.addHandler(handler)
+            logger.setLevel(logging.INFO)
+            logger.propagate = False
+        if Config.METRICS_FILE:
+            # Fichier retiré à l'arrêt : /metrics n'agrège que les processus vivants
+            atexit.register(metrics_file(os.getpid()).unlink, missing_ok=True)
+
+    def observe(self, name: str, seconds: float):
+        with self._lock:
+            span = self.spans.setdefault(name, [0, 0.0, 0.0])
+            span[0] += 1
+            span[1] += seconds
+            span[2] = max(span[2], seconds)
+
+    def count_cache(self, name: str, miss: bool = False):
+        """Compte un appel au cache `name` (miss=True : la valeur a dû être calculée)"""
+        with self._lock:
+            counts = self.cache.setdefault(name, [0, 0])
+            counts[1 if miss else 0] += 1
+
+    def add_payload(self, name: str, size: int):
+        with self._lock:
+            self.payload[name] = self.payload.get(name, 0) + size
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            return {
+                "spans": {name: {"count": c, "total_ms": t * 1000, "max_ms": m * 1000} for name, (c, t, m) in self.spans.items()},
+                "cache": {name: {"hits": hits, "misses": misses} for name, (hits, misses) in self.cache.items()},
+                "payload_bytes": dict(self.payload),
+            }
+
+    def prometheus(self) -> str:
+        """Métriques au format texte d'exposition Prometheus"""
+        snapshot = self.snapshot()
+        pid = os.getpid()  # Label distinguant les séries des différents workers
+        lines = ["# TYPE portfolio_span_seconds summary"]
+        for name, span in snapshot["spans"].items():
+            lines.append(f'portfolio_span_seconds_count{{span="{name}",pid="{pid}"}} {span["count"]}')
+            lines.append(f'portfolio_span_seconds_sum{{span="{name}",pid="{pid}"}} {span["total_ms"] / 1000:.6f}')
+        lines.append("# TYPE portfolio_cache_requests_total counter")
+        for name, cache in snapshot["cache"].items():
+            lines.append(f'portfolio_cache_requests_total{{cache="{name}",result="hit",pid="{pid}"}} {cache["hits"]}')
+            lines.append(f'portfolio_cache_requests_total{{cache="{name}",result="miss",pid="{pid}"}} {cache["misses"]}')
+        lines.append("# TYPE portfolio_payload_bytes_total counter")
+        for name, size in snapshot["payload_bytes"].items():
+            lines.append(f'portfolio_payload_bytes_total{{span="{name}",pid="{pid}"}} {size}')
+        return "\n".join(lines) + "\n"
+
+    def maybe_flush(self):
+        """Journalise (JSON) et exporte les métriques au plus une fois par intervalle"""
+        now = time.monotonic()
+        with self._lock:
+            if now - self.last_flush < Config.METRICS_LOG_INTERVAL:
+                return
+            self.last_flush = now
+        logger.info(json.dumps(self.snapshot()))
+        if Config.METRICS_FILE:
+            path = metrics_file(os.getpid())
+            tmp = path.with_name(f".{path.name}.tmp")
+            try:
+                tmp.write_text(self.prometheus())
+                tmp.replace(path)
+            except OSError as exc:
+                logger.warning("métriques non exportées vers %s (%r)", path, exc)
+
+@st.cache_resource
+def get_metrics() -> Metrics:
+    """Métriques du processus, partagées entre sessions et reruns"""
+    return Metrics()
+
+@contextmanager
+def span(name: str):
+    """Mesure la durée du bloc ; les octets émis à l'intérieur lui sont attribués"""
+    if not Config.METRICS_ENABLED:
+        yield
+        return
+    token = _current_span.set(name)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        get_metrics().observe(name, time.perf_counter() - start)
+        _current_span.reset(token)
+
+def instrumented(name: str):
+    """Décorateur : chaque appel est mesuré dans un span `name`"""
+    def decorator(fn):
+        if not Config.METRICS_ENABLED:
+            return fn
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def cached(name: str, cache_decorator):
+    """Applique un cache Streamlit (st.cache_data / st.cache_resource) en comptant hits et misses"""
+    def decorator(fn):
+        if not Config.METRICS_ENABLED:
+            return cache_decorator(fn)
+        computed = threading.local()  # Marqué par `compute`, exécuté seulement en cas de miss
+
+        @functools.wraps(fn)
+        def compute(*args, **kwargs):
+            computed.flag = True
+            return fn(*args, **kwargs)
+        cached_fn = cache_decorator(compute)
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            computed.flag = False
+            result = cached_fn(*args, **kwargs)
+            get_metrics().count_cache(name, miss=computed.flag)
+            return result
+        return wrapper
+    return decorator
+
+def emit_html(markup: str):
+    """st.markdown HTML, avec comptage des octets émis par span"""
+    if Config.METRICS_ENABLED:
+        get_metrics().add_payload(_current_span.get(), len(markup.encode()))
+    st.markdown(markup, unsafe_allow_html=True)
+
+# ============================================
+# ANALYSE DES COMPÉTENCES (agrégats et graphiques)
+# ============================================
+@cached("skills_aggregates", st.cache_data(max_entries=4))
+def build_skills_aggregates(skills_version: int, projects_version: int) -> Dict[str, "pd.DataFrame"]:
+    """Agrégats vectorisés des compétences et de l'usage des technologies dans les projets"""
+    skills = read_data_file("skills", skills_version)
+    technical = pd.DataFrame.from_dict(skills["technical"], orient="index")[["level", "category", "years"]]
+    technical = technical.rename_axis("skill").reset_index().sort_values("level", ascending=False)
+    soft = pd.Series(skills["soft"], name="level").rename_axis("skill").reset_index()
+    projects = pd.DataFrame(read_data_file("projects", projects_version), columns=["technologies", "year"])
+    usage = (projects.explode("technologies")["technologies"].dropna()
+             .value_counts().rename_axis("technology").reset_index(name="projects"))
+    return {"technical": technical, "soft": soft, "usage": usage}
+
+def _style_figure(fig: "go.Figure", title: str) -> "go.Figure":
+    fig.update_layout(
+        title=title,
+        paper_bgcolor="rgba(0,0,0,0)",
+        plot_bgcolor="rgba(0,0,0,0)",
+        font={"color": Config.COLORS["light"]},
+        margin={"l": 10, "r": 10, "t": 50, "b": 10},
+        height=360,
+    )
+    return fig
+
+@cached("skills_figures", st.cache_resource(max_entries=4))
+def build_skills_figures(skills_version: int, projects_version: int, year: int) -> Dict[str, "go.Figure"]:
+    """Graphiques de la section WHAT I DO, construits une fois par version des données.
+
+    Objets partagés entre sessions (cache_resource) : ils ne sont ni copiés
+    ni désérialisés à chaque rerun, et ne doivent pas être modifiés.
+    """
+    data = build_skills_aggregates(skills_version, projects_version)
+    technical, soft, usage = data["technical"], data["soft"], data["usage"]
+    accent = Config.COLORS["accent"]
+
+    radar = go.Figure(go.Scatterpolar(
+        r=list(soft["level"]) + soft["level"].iloc[:1].tolist(),
+        theta=list(soft["skill"]) + soft["skill"].iloc[:1].tolist(),
+        fill="toself", line={"color": accent},
+    ))
+    radar.update_polars(bgcolor="rgba(0,0,0,0)", radialaxis={"range": [0, 100]})
+
+    levels = go.Figure(go.Bar(x=technical["level"], y=technical["skill"], orientation="h", marker={"color": accent}))
+    levels.update_yaxes(autorange="reversed")
+
+    by_years = technical.sort_values("years")
+    timeline = go.Figure(go.Bar(
+        x=by_years["years"], y=by_years["skill"], base=year - by_years["years"],
+        orientation="h", marker={"color": accent},
+        hovertemplate="%{y} : depuis %{base}<extra></extra>",
+    ))
+
+    tech_usage = go.Figure(go.Bar(x=usage["technology"], y=usage["projects"], marker={"color": accent}))
+
     return {
-        "personal": {
-            "name": "Marwane Houngnon",
-            "title": "Statistician | Data Science & AI Researcher | Consultant",
-            "photo": "assets/images/moi.jpeg", # Chemin original conservé
-            "email": "alberichoun.del@gmail.com",
-            "phone": "(+212) 641-364-029",
-            "location": "Casablanca, Morocco",
-            "summary": """
-            AI/ML Engineer with two years of integrated academic, research, and industry experience, with a strong focus on 
-            predictive modeling, deep learning, and computer vision. Demonstrated ability to design, implement, and evaluate 
-            end-to-end machine learning pipelines, from data preprocessing to model optimization and deployment. Skilled in 
-            developing and operationalizing advanced AI systems leveraging Docker-based workflows and core AWS services. 
-            Academic contributions include co-authored publications in reputable journals (Web of Science, Taylor & Francis).
-            """
-        },
-        "social": {
-            "github": {"url": "https://github.com/Thekidmaroi", "icon": "https://cdn-icons-png.flaticon.com/512/25/25231.png", "name": "GitHub"},
-            "linkedin": {"url": "https://linkedin.com/in/marwane-houngnon", "icon": "https://cdn-icons-png.flaticon.com/512/174/174857.png", "name": "LinkedIn"},
-            "kaggle": {"url": "https://kaggle.com/marwanehoungnon", "icon": "https://cdn-icons-png.flaticon.com/512/5968/5968850.png", "name": "Kaggle"},
-            "email": {"url": "mailto:alberichoun.del@gmail.com", "icon": "https://cdn-icons-png.flaticon.com/512/732/732200.png", "name": "Email"}
-        },
-        "stats": {
-            "projects": 15,
-            "years_exp": 2,
-            "technologies": 30,
-            "publications": 4,
-            "models": 10
-        }
+        "radar": _style_figure(radar, "Soft skills"),
+        "levels": _style_figure(levels, "Niveau technique (%)"),
+        "timeline": _style_figure(timeline, "Années de pratique"),
+        "usage": _style_figure(tech_usage, "Technologies utilisées dans les projets"),
     }
 
-@st.cache_data(ttl=Config.CACHE_TTL)
+# ============================================
+# CACHE PARTAGÉ (multi-processus / multi-réplicas)
+# ============================================
+def shared_key(namespace: str, *parts) -> str:
+    """Clé de contenu : hash des entrées qui déterminent entièrement la valeur"""
+    payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+    return f"{namespace}:{hashlib.sha256(payload.encode()).hexdigest()}"
+
+cache_logger = logging.getLogger("portfolio.cache")
+
+class CacheBackend(ABC):
+    """Cache d'octets partagé entre processus, avec calcul unique en cas de miss.
+
+    Les implémentations fournissent get/set et un verrou de calcul
+    (acquire/release) visible de tous les processus.
+    """
+
+    POLL_INTERVAL = 0.05
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        ...
+
+    @abstractmethod
+    def set(self, key: str, value: bytes):
+        ...
+
+    @abstractmethod
+    def acquire(self, key: str, owner: str, ttl: float) -> bool:
+        ...
+
+    @abstractmethod
+    def release(self, key: str, owner: str):
+        ...
+
+    def get_or_compute(self, key: str, compute: Callable[[], bytes]) -> bytes:
+        """Valeur en cache, sinon calculée par un seul processus pendant que les autres attendent.
+
+        Le cache partagé n'est qu'une optimisation : si le backend échoue
+        (Redis injoignable, disque plein...), l'erreur est journalisée et la
+        valeur calculée localement. Les erreurs de `compute` remontent telles quelles.
+        """
+        state = {}
+
+        def compute_once() -> bytes:
+            state["started"] = True
+            state["value"] = compute()
+            return state["value"]
+
+        try:
+            return self._single_flight(key, compute_once)
+        except Exception as exc:
+            if state.get("started") and "value" not in state:
+                raise
+            cache_logger.warning("cache partagé indisponible pour %s (%r), calcul local", key, exc)
+            return state["value"] if "value" in state else compute()
+
+    def _single_flight(self, key: str, compute: Callable[[], bytes]) -> bytes:
+        value = self.get(key)
+        if value is not None:
+            return value
+        owner = f"{os.getpid()}:{threading.get_ident()}"
+        deadline = time.monotonic() + Config.SHARED_CACHE_LOCK_TTL
+        while time.monotonic() < deadline:
+            if self.acquire(key, owner, Config.SHARED_CACHE_LOCK_TTL):
+                try:
+                    value = self.get(key)
+                    if value is None:
+                        value = compute()
+                        self.set(key, value)
+                    return value
+                finally:
+                    self.release(key, owner)
+            time.sleep(self.POLL_INTERVAL)
+            value = self.get(key)
+            if value is not None:
+                return value
+        # Détenteur du verrou trop lent ou disparu : on calcule localement
+        return compute()
+
+class NullCacheBackend(CacheBackend):
+    """Aucun partage : chaque processus calcule (comportement par défaut)"""
+
+    def get(self, key: str) -> Optional[bytes]:
+        return None
+
+    def set(self, key: str, value: bytes):
+        pass
+
+    def acquire(self, key: str, owner: str, ttl: float) -> bool:
+        return True
+
+    def release(self, key: str, owner: str):
+        pass
+
+    def get_or_compute(self, key: str, compute: Callable[[], bytes]) -> bytes:
+        return compute()
+
+class DiskCacheBackend(CacheBackend):
+    """Cache SQLite sur disque local, partagé par les processus d'une même machine.
+
+    Éviction LRU dès que la taille totale dépasse `max_bytes`.
+    """
+
+    def __init__(self, path: Path, max_bytes: int):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as db:
+            db.execute("CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, value BLOB, size INTEGER, accessed REAL)")
+            db.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)")
+            db.execute("CREATE TABLE IF NOT EXISTS locks (key TEXT PRIMARY KEY, owner TEXT, expires REAL)")
+
+    def _connect(self) -> sqlite3.Connection:
+        db = getattr(self._local, "db", None)
+        if db is None:
+            db = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            db.execute("PRAGMA journal_mode=WAL")
+            self._local.db = db
+        return db
+
+    def get(self, key: str) -> Optional[bytes]:
+        db = self._connect()
+        row = db.execute("SELECT value FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        db.execute("UPDATE entries SET accessed = ? WHERE key = ?", (time.time(), key))
+        return bytes(row[0])
+
+    def set(self, key: str, value: bytes):
+        db = self._connect()
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            db.execute("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)", (key, value, len(value), time.time()))
+            total = db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+            for old_key, size in db.execute("SELECT key, size FROM entries WHERE key != ? ORDER BY accessed", (key,)).fetchall():
+                if total <= self.max_bytes:
+                    break
+                db.execute("DELETE FROM entries WHERE key = ?", (old_key,))
+                total -= size
+            db.execute("COMMIT")
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+
+    def acquire(self, key: str, owner: str, ttl: float) -> bool:
+        db = self._connect()
+        now = time.time()
+        db.execute("DELETE FROM locks WHERE key = ? AND expires < ?", (key, now))
+        return db.execute("INSERT OR IGNORE INTO locks VALUES (?, ?, ?)", (key, owner, now + ttl)).rowcount == 1
+
+    def release(self, key: str, owner: str):
+        self._connect().execute("DELETE FROM locks WHERE key = ? AND owner = ?", (key, owner))
+
+class RedisCacheBackend(CacheBackend):
+    """Cache Redis partagé entre réplicas.
+
+    `client` est tout objet compatible redis-py (redis.Redis, fakeredis...).
+    L'éviction est confiée à Redis (maxmemory + allkeys-lru) ; les valeurs
+    plus grandes que `max_value_bytes` ne sont pas stockées.
+    """
+
+    # Suppression du verrou seulement s'il appartient encore à `owner`, en une
+    # opération atomique : un verrou expiré puis repris par un autre réplica
+    # entre la lecture et la suppression n'est jamais effacé.
+    RELEASE_SCRIPT = 'if redis.call("get", KEYS[1]) == ARGV[1] then return redis.call("del", KEYS[1]) end return 0'
+
+    def __init__(self, client, max_value_bytes: int, prefix: str = "portfolio:"):
+        self.client = client
+        self.max_value_bytes = max_value_bytes
+        self.prefix = prefix
+        self._release = client.register_script(self.RELEASE_SCRIPT)
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.client.get(self.prefix + key)
+
+    def set(self, key: str, value: bytes):
+        if len(value) <= self.max_value_bytes:
+            self.client.set(self.prefix + key, value)
+
+    def acquire(self, key: str, owner: str, ttl: float) -> bool:
+        return bool(self.client.set(f"{self.prefix}lock:{key}", owner, nx=True, px=int(ttl * 1000)))
+
+    def release(self, key: str, owner: str):
+        self._release(keys=[f"{self.prefix}lock:{key}"], args=[owner])
+
+@st.cache_resource
+def get_shared_cache() -> CacheBackend:
+    """Backend de cache partagé choisi par Config.CACHE_BACKEND (aucun partage s'il ne peut être créé)"""
+    if Config.CACHE_BACKEND not in ("none", "disk", "redis"):
+        raise ValueError(f"Config.CACHE_BACKEND inconnu : {Config.CACHE_BACKEND!r}")
+    try:
+        if Config.CACHE_BACKEND == "disk":
+            return DiskCacheBackend(Config.CACHE_DIR / "shared.sqlite", Config.SHARED_CACHE_MAX_BYTES)
+        if Config.CACHE_BACKEND == "redis":
+            redis = importlib.import_module("redis")
+            client = redis.Redis.from_url(Config.CACHE_URL, socket_connect_timeout=Config.SHARED_CACHE_TIMEOUT,
+                                          socket_timeout=Config.SHARED_CACHE_TIMEOUT)
+            return RedisCacheBackend(client, Config.SHARED_CACHE_MAX_BYTES // 16)
+    except (ImportError, OSError, sqlite3.Error):
+        cache_logger.warning("cache partagé %r indisponible, aucun partage", Config.CACHE_BACKEND, exc_info=True)
+    return NullCacheBackend()
+
+# ============================================
+# DONNÉES (fichiers JSON sous Config.DATA_DIR)
+# ============================================
+def data_path(name: str) -> Path:
+    """Chemin du fichier de données <name>.json"""
+    return Config.DATA_DIR / f"{name}.json"
+
+def data_version(name: str) -> int:
+    """Date de modification (ns) du fichier : clé d'invalidation du cache"""
+    return data_path(name).stat().st_mtime_ns
+
+@cached("read_data_file", st.cache_data(max_entries=len(Config.DATA_FILES) * 2))
+def read_data_file(name: str, version: int):
+    """Lit un fichier de données ; une nouvelle version invalide l'entrée précédente"""
+    with open(data_path(name), encoding="utf-8") as f:
+        return json.load(f)
+
+@instrumented("load_profile_data")
+def load_profile_data() -> Dict:
+    """Charge les données du profil avec cache"""
+    return read_data_file("profile", data_version("profile"))
+
+@instrumented("load_projects_data")
 def load_projects_data() -> List[Dict]:
     """Charge la liste des projets avec cache"""
-    return [
-        {
-            "id": 1,
-            "title": "🤖 LLM Containerized Pipeline",
-            "category": "Generative AI • MLOps",
-            "description": "Déploiement de modèles Mistral et DeepSeek via Docker pour l'automatisation de réponses clients.",
-            "technologies": ["Python", "Mistral", "DeepSeek", "Docker", "Transformers", "FastAPI"],
-            "features": ["Fine-tuning", "Conteneurisation", "API REST", "Optimisation de latence"],
-            "client": "SRM-CS",
-            "year": 2025,
-            "github": "https://github.com/Thekidmaroi",
-            "metrics": {"Latence": "-25%", "Précision": "92%", "Status": "Production"}
-        },
-        {
-            "id": 2,
-            "title": "🎯 Adaptive Recommendation Engine",
-            "category": "Machine Learning • Career Guidance",
-            "description": "Système SOIPA pour l'orientation de carrière basé sur des tests psychométriques personnalisés.",
-            "technologies": ["Python", "Scikit-learn", "Pandas", "Streamlit", "Statistical Modeling"],
-            "features": ["Recommandation adaptative", "Tests psychométriques", "Dashboard interactif"],
-            "client": "Web4Jobs",
-            "year": 2025,
-            "github": "https://github.com/Thekidmaroi",
-            "metrics": {"Engagement": "+15%", "Précision": "88%", "Users": "Active"}
-        }
-    ]
+    return read_data_file("projects", data_version("projects"))
 
-@st.cache_data(ttl=Config.CACHE_TTL)
+@instrumented("load_research_data")
 def load_research_data() -> List[Dict]:
     """Charge les projets de recherche (publications)"""
-    return [
-        {
-            "title": "Missing Data Robust EM for Incentive-Aware Markovian Smart Grid Optimization",
-            "journal": "Web of Science Indexed Journal",
-            "status": "Accepted and presented",
-            "description": "Optimization of smart grid resources using Markov models robust to missing data."
-        },
-        {
-            "title": "Dynamic Fusion of Hidden Markov Models and Neural Networks for Adaptive Pattern Recognition in Multimodal Environments",
-            "journal": "Taylor & Francis Journal",
-            "status": "Accepted and presented",
-            "description": "Hybrid approach combining HMM and NN for pattern recognition."
-        },
-        {
-            "title": "Markov-Optimized Resource Allocation for Sustainable 6G Mediterranean Smart Cities",
-            "journal": "International Conference",
-            "status": "Accepted and Presented",
-            "description": "Resource allocation strategies for 6G networks in smart city contexts."
-        },
-        {
-            "title": "Modeling Smart City Governance Transitions with HMM and Public IoT Data",
-            "journal": "Research Paper",
-            "status": "Accepted and Presented",
-            "description": "Using IoT data and Hidden Markov Models to model governance transitions."
-        }
-    ]
+    return read_data_file("research", data_version("research"))
 
-@st.cache_data(ttl=Config.CACHE_TTL)
+@instrumented("load_skills_data")
 def load_skills_data() -> Dict:
     """Charge les compétences avec cache"""
-    return {
-        "technical": {
-            "Python": {"level": 95, "category": "Languages", "years": 4, "logo": "https://cdn-icons-png.flaticon.com/512/5968/5968350.png"},
-            "R": {"level": 82, "category": "Languages", "years": 2, "logo": "https://cdn-icons-png.flaticon.com/512/2103/2103601.png"},
-            "SQL": {"level": 90, "category": "Databases", "years": 4, "logo": "https://cdn-icons-png.flaticon.com/512/4248/4248443.png"},
-            "Machine Learning": {"level": 92, "category": "ML/DL", "years": 3, "logo": "https://cdn-icons-png.flaticon.com/512/2103/2103633.png"},
-            "Deep Learning": {"level": 88, "category": "ML/DL", "years": 2, "logo": "https://cdn-icons-png.flaticon.com/512/8618/8618881.png"},
-            "Computer Vision": {"level": 90, "category": "ML/DL", "years": 2, "logo": "https://cdn-icons-png.flaticon.com/512/10522/10522283.png"},
-            "LLMs (Mistral/DeepSeek)": {"level": 85, "category": "ML/DL", "years": 1, "logo": "https://cdn-icons-png.flaticon.com/512/8618/8618847.png"},
-            "Docker": {"level": 88, "category": "MLOps & Cloud", "years": 2, "logo": "https://cdn-icons-png.flaticon.com/512/919/919853.png"},
-            "AWS": {"level": 82, "category": "MLOps & Cloud", "years": 1, "logo": "https://cdn-icons-png.flaticon.com/512/5968/5968412.png"},
-            "Power BI": {"level": 85, "category": "Tools", "years": 1, "logo": "https://upload.wikimedia.org/wikipedia/commons/c/cf/New_Power_BI_Logo.svg"},
-            "Git": {"level": 92, "category": "Tools", "years": 4, "logo": "https://cdn-icons-png.flaticon.com/512/4494/4494740.png"},
-            "Streamlit": {"level": 90, "category": "Tools", "years": 2, "logo": "https://streamlit.io/images/brand/streamlit-mark-color.png"}
-        },
-        "soft": {
-            "Problem Solving": 95,
-            "Technical Communication": 90,
-            "Teamwork": 88,
-            "Project Management": 85,
-            "Analytical Thinking": 92
-        }
-    }
+    return read_data_file("skills", data_version("skills"))
 
-@st.cache_data(ttl=Config.CACHE_TTL)
+@instrumented("load_experience_data")
 def load_experience_data() -> List[Dict]:
     """Charge les expériences professionnelles avec cache"""
-    return [
-        {
-            "company": "Web4Jobs",
-            "position": "AI Developer Intern",
-            "period": "May – July 2025",
-            "location": "Casablanca, Morocco",
-            "description": "Optimisation de l'engagement utilisateur via des systèmes de recommandation.",
-            "achievements": [
-                "Engineered an adaptive recommendation engine (within the SOIPA system) for career guidance, increasing user engagement by 15% through personalized psychometric test paths.",
-                "Integrated the recommendation engine into a user-facing web interface."
-            ]
-        },
-        {
-            "company": "SRM-CS",
-            "position": "AI Engineer Intern",
-            "period": "April – July 2025",
-            "location": "Casablanca, Morocco",
-            "description": "Développement et déploiement de solutions LLM et classification sémantique.",
-            "achievements": [
-                "Developed and containerized a Large Language Model (LLM) using Docker and fine-tuned transformer models (Mistral, DeepSeek) for automated text generation from client requests.",
-                "Reduced average query processing time by 25% through LLM-based response automation.",
-                "Designed a multi-label classification pipeline for semantic annotation of customer complaints, improving routing accuracy by 92%.",
-                "Built a real-time monitoring dashboard (Power BI) to track model performance and drift."
-            ]
-        },
-        {
-            "company": "Galenica (Laboratoire Pharmaceutique)",
-            "position": "Commercial Data Analyst Intern",
-            "period": "Stage",
-            "location": "Casablanca, Morocco",
-            "description": "Leveraging data to optimize strategic decision-making.",
-            "achievements": [
-                "Design interactive dashboards and conduct performance analyses using Power BI and SQL Server.",
-                "Automate processes to enhance operational efficiency.",
-                "Contribute to the integration of artificial intelligence solutions."
-            ]
-        }
-    ]
+    return read_data_file("experience", data_version("experience"))
+
+def split_categories(category: str) -> List[str]:
+    """Découpe une catégorie composée ("Generative AI • MLOps")"""
+    return [c.strip() for c in category.split("•") if c.strip()]
+
+@cached("project_indexes", st.cache_resource(max_entries=2))
+def build_project_indexes(version: int) -> Dict[str, Dict]:
+    """Index en mémoire des projets : valeur -> positions dans load_projects_data().
+
+    Partagé entre sessions (cache_resource, sans copie) : à traiter en lecture seule.
+    """
+    indexes = {"category": {}, "year": {}, "client": {}, "technology": {}}
+    for position, project in enumerate(read_data_file("projects", version)):
+        for category in split_categories(project.get("category", "")):
+            indexes["category"].setdefault(category, []).append(position)
+        if project.get("year") is not None:
+            indexes["year"].setdefault(project["year"], []).append(position)
+        if project.get("client"):
+            indexes["client"].setdefault(project["client"], []).append(position)
+        for tech in project.get("technologies", []):
+            indexes["technology"].setdefault(tech, []).append(position)
+    return indexes
+
+@instrumented("load_project_indexes")
+def load_project_indexes() -> Dict[str, Dict]:
+    """Index des projets par catégorie, année, client et technologie"""
+    return build_project_indexes(data_version("projects"))
+
+@cached("filter_projects", st.cache_data(max_entries=256))
+def filter_projects(version: int, filters: Tuple[Tuple[str, Tuple], ...]) -> List[int]:
+    """Positions des projets correspondant aux filtres, mises en cache par requête.
+
+    `filters` associe un nom d'index aux valeurs retenues : OU entre les valeurs
+    d'un même index, ET entre index différents.
+    """
+    indexes = build_project_indexes(version)
+    selected = None
+    for field, values in filters:
+        if not values:
+            continue
+        matches = set()
+        for value in values:
+            matches.update(indexes[field].get(value, ()))
+        selected = matches if selected is None else selected & matches
+    if selected is None:
+        return list(range(len(read_data_file("projects", version))))
+    return sorted(selected)
+
+# ============================================
+# RECHERCHE PLEIN TEXTE (BM25)
+# ============================================
+# Jeu de données -> champs indexés
+SEARCH_FIELDS = {
+    "projects": ("title", "category", "description", "technologies", "features"),
+    "research": ("title", "journal", "description"),
+    "experience": ("position", "company", "description", "achievements"),
+}
+_TOKEN_RE = re.compile(r"\w+")
+
+def tokenize(text: str) -> List[str]:
+    """Mots en minuscules et sans accents ("Précision" -> "precision")"""
+    text = unicodedata.normalize("NFKD", text.lower())
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    return _TOKEN_RE.findall(text)
+
+def _document_text(record: Dict, fields: Tuple[str, ...]) -> str:
+    parts = []
+    for field in fields:
+        value = record.get(field, "")
+        parts.extend(value if isinstance(value, list) else [str(value)])
+    return " ".join(parts)
+
+class SearchIndex:
+    """Index BM25 en mémoire : une liste de postings (documents, fréquences) NumPy par terme"""
+
+    K1 = 1.5
+    B = 0.75
+
+    def __init__(self, documents: List[Dict]):
+        self.documents = documents
+        lengths = np.array([sum(doc["terms"].values()) for doc in documents], dtype=np.float64)
+        avg_length = lengths.mean() if len(documents) and lengths.mean() > 0 else 1.0
+        self._norm = self.K1 * (1 - self.B + self.B * lengths / avg_length)
+        postings: Dict[str, Tuple[List[int], List[int]]] = {}
+        for doc_id, doc in enumerate(documents):
+            for term, count in doc["terms"].items():
+                ids, counts = postings.setdefault(term, ([], []))
+                ids.append(doc_id)
+                counts.append(count)
+        n = len(documents)
+        self._postings = {}
+        for term, (ids, counts) in postings.items():
+            idf = np.log(1 + (n - len(ids) + 0.5) / (len(ids) + 0.5))
+            self._postings[term] = (np.array(ids, dtype=np.int32), np.array(counts, dtype=np.float64), idf)
+
+    def search(self, query: str, limit: int = 20) -> List[Tuple[Dict, float]]:
+        """Documents classés par score BM25 décroissant"""
+        scores = np.zeros(len(self.documents))
+        for term in set(tokenize(query)):
+            if term not in self._postings:
+                continue
+            ids, counts, idf = self._postings[term]
+            scores[ids] += idf * counts * (self.K1 + 1) / (counts + self._norm[ids])
+        hits = np.flatnonzero(scores)
+        if len(hits) > limit:
+            hits = hits[np.argpartition(-scores[hits], limit)[:limit]]
+        hits = hits[np.argsort(-scores[hits], kind="stable")]
+        return [(self.documents[i], float(scores[i])) for i in hits]
+
+def _read_persisted_documents(path: Path) -> List[Dict]:
+    try:
+        with open(path, encoding="utf-8") as f:
+            documents = json.load(f)["documents"]
+        return [doc for doc in documents if "hash" in doc and "terms" in doc]
+    except (OSError, ValueError, KeyError, TypeError):
+        return []
+
+@cached("search_index", st.cache_resource(max_entries=2))
+def build_search_index(versions: Tuple[int, ...]) -> SearchIndex:
+    """Construit l'index pour une version donnée des données.
+
+    Les termes de chaque document sont persistés dans Config.INDEX_DIR et
+    retrouvés par le hash de leur contenu, pas par leur position : insérer
+    ou supprimer un enregistrement ne re-tokenise que celui-ci. Le fichier
+    n'est réécrit que si quelque chose a changé.
+    """
+    path = Config.INDEX_DIR / "search.json"
+    persisted = _read_persisted_documents(path)
+    known_terms = {doc["hash"]: doc["terms"] for doc in persisted}
+    documents = []
+    for (kind, fields), version in zip(SEARCH_FIELDS.items(), versions):
+        for position, record in enumerate(read_data_file(kind, version)):
+            text = _document_text(record, fields)
+            digest = content_hash(text.encode())
+            terms = known_terms.get(digest)
+            if terms is None:
+                terms = {}
+                for term in tokenize(text):
+                    terms[term] = terms.get(term, 0) + 1
+                known_terms[digest] = terms
+            documents.append({
+                "key": f"{kind}:{position}",
+                "kind": kind,
+                "position": position,
+                "hash": digest,
+                "title": record.get("title") or f"{record.get('position', '')} — {record.get('company', '')}",
+                "snippet": record.get("description", "")[:200],
+                "terms": terms,
+            })
+    if [(doc["key"], doc["hash"]) for doc in documents] != [(doc.get("key"), doc["hash"]) for doc in persisted]:
+        try:
+            Config.INDEX_DIR.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps({"documents": documents}, ensure_ascii=False), encoding="utf-8")
+            tmp.replace(path)
+        except OSError:
+            pass  # Système de fichiers en lecture seule : l'index reste en mémoire
+    return SearchIndex(documents)
+
+@instrumented("load_search_index")
+def load_search_index() -> SearchIndex:
+    """Index de recherche correspondant aux fichiers de données actuels"""
+    return build_search_index(tuple(data_version(kind) for kind in SEARCH_FIELDS))
+
+# ============================================
+# ASSETS STATIQUES (Performance)
+# ============================================
+def content_hash(data: bytes) -> str:
+    """Empreinte courte du contenu, utilisée pour versionner les fichiers"""
+    return hashlib.sha256(data).hexdigest()[:12]
+
+def static_url(name: str) -> str:
+    """URL publique d'un fichier de Config.STATIC_DIR"""
+    return f"{Config.STATIC_URL}/{name}"
+
+def static_serving_enabled() -> bool:
+    """Les fichiers de STATIC_DIR sont-ils accessibles par URL ?"""
+    if Config.STATIC_SERVING is not None:
+        return Config.STATIC_SERVING
+    if "://" in Config.STATIC_URL:
+        return True  # Serveur de fichiers dédié (scripts/serve_static.py, CDN)
+    return bool(st.get_option("server.enableStaticServing"))
+
+def _write_atomic(target: Path, data: bytes):
+    tmp = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    tmp.replace(target)
+
+def precompress(path: Path) -> List[Path]:
+    """Écrit à côté du fichier ses variantes .gz et, si le module brotli est installé, .br"""
+    data = path.read_bytes()
+    variants = {".gz": lambda: gzip.compress(data, compresslevel=9, mtime=0)}
+    try:
+        brotli = importlib.import_module("brotli")
+        variants[".br"] = lambda: brotli.compress(data, quality=11)
+    except ImportError:
+        pass
+    written = []
+    for suffix, compress in variants.items():
+        target = path.with_name(path.name + suffix)
+        _write_atomic(target, compress())
+        written.append(target)
+    return written
+
+static_logger = logging.getLogger("portfolio.static")
+
+def write_static(name: str, data: bytes) -> Optional[Path]:
+    """Écrit un fichier dans STATIC_DIR de façon atomique (ignoré s'il existe déjà).
+
+    Les fichiers texte sont accompagnés de leurs variantes compressées,
+    servies selon Accept-Encoding par scripts/serve_static.py.
+    Renvoie None si l'écriture échoue (système de fichiers en lecture seule,
+    disque plein) : l'appelant embarque alors le contenu dans la page.
+    """
+    target = Config.STATIC_DIR / name
+    try:
+        if not target.exists():
+            Config.STATIC_DIR.mkdir(parents=True, exist_ok=True)
+            _write_atomic(target, data)
+            if target.suffix in Config.STATIC_COMPRESSIBLE:
+                precompress(target)
+    except OSError as exc:
+        static_logger.warning("%s non publié (%r), contenu embarqué dans la page", name, exc)
+        return None
+    return target
+
+def encode_webp(source: bytes, width: int, quality: int) -> bytes:
+    """Réduit une image à `width` px de large (sans agrandir) et l'encode en WebP"""
+    image = ImageOps.exif_transpose(Image.open(io.BytesIO(source)))
+    image = image.convert("RGBA" if "A" in image.getbands() else "RGB")
+    image.thumbnail((width, width * 4), Image.LANCZOS)
+    buffer = io.BytesIO()
+    image.save(buffer, "WEBP", quality=quality, method=6)
+    return buffer.getvalue()
+
+def background_variant(source: bytes, width: int) -> bytes:
+    """Image de fond en WebP à `width` px (cache partagé entre processus)"""
+    key = shared_key("image", content_hash(source), width, Config.BACKGROUND_QUALITY)
+    return get_shared_cache().get_or_compute(key, lambda: encode_webp(source, width, Config.BACKGROUND_QUALITY))
+
+@cached("background_variants", st.cache_resource)
+def build_background_variants(mtime_ns: int) -> Dict[int, str]:
+    """Transcode l'image de fond en WebP redimensionnés, une seule fois par version du fichier.
+
+    Les variantes sont nommées d'après le hash du PNG source : un fichier déjà
+    présent sur disque n'est jamais ré-encodé. Renvoie {largeur: nom de fichier}
+    des variantes publiées (aucune si STATIC_DIR n'est pas accessible en écriture).
+    """
+    source = Config.BACKGROUND_IMAGE.read_bytes()
+    digest = content_hash(source)
+    variants = {}
+    for width in sorted(Config.BACKGROUND_WIDTHS):
+        name = f"bg-{digest}-{width}.webp"
+        if (Config.STATIC_DIR / name).exists() or write_static(name, background_variant(source, width)):
+            variants[width] = name
+    return variants
+
+@cached("background_css", st.cache_data)
+def background_css(mtime_ns: int) -> str:
+    """Bloc <style> du fond d'écran : quelques centaines d'octets au lieu du PNG en base64"""
+    variants = build_background_variants(mtime_ns)
+    widths = sorted(Config.BACKGROUND_WIDTHS)
+    if static_serving_enabled() and len(variants) == len(widths):
+        urls = {w: static_url(variants[w]) for w in widths}
+    else:
+        # Sans service statique (ou variantes non publiées) : seule la plus petite est embarquée
+        path = Config.STATIC_DIR / variants[widths[0]] if widths[0] in variants else None
+        data = path.read_bytes() if path else background_variant(Config.BACKGROUND_IMAGE.read_bytes(), widths[0])
+        urls = {w: f"data:image/webp;base64,{base64.b64encode(data).decode()}" for w in widths}
+    media_queries = "".join(
+        f'@media (max-width: {w}px) {{ .stApp {{ background-image: url("{urls[w]}"); }} }}'
+        for w in reversed(widths[:-1])
+    )
+    return f"""
+    <style>
+    .stApp {{
+        background-image: url("{urls[widths[-1]]}");
+        background-size: cover;
+        background-attachment: fixed;
+    }}
+    {media_queries}
+    .stApp::before {{
+        content: "";
+        position: fixed;
+        top: 0; left: 0; width: 100%; height: 100%;
+        background: {Config.COLORS['overlay']};
+        backdrop-filter: blur(80px);
+        z-index: -1;
+    }}
+    </style>
+    """
+
+@cached("icon_sprite", st.cache_resource(max_entries=2))
+def build_icon_sprite(mtime_ns: int) -> Dict:
+    """Publie le sprite des logos sous un nom versionné et renvoie son manifeste"""
+    manifest = json.loads((Config.ICONS_DIR / "sprite.json").read_text(encoding="utf-8"))
+    data = (Config.ICONS_DIR / manifest["sprite"]).read_bytes()
+    name = f"icons-{content_hash(data)}.png"
+    if static_serving_enabled() and write_static(name, data):
+        manifest["file"] = name
+        manifest["url"] = static_url(name)
+    else:
+        manifest["url"] = f"data:image/png;base64,{base64.b64encode(data).decode()}"
+    return manifest
+
+def sprite_version() -> int:
+    """mtime du manifeste du sprite (0 s'il n'existe pas) : les icônes changent avec lui"""
+    path = Config.ICONS_DIR / "sprite.json"
+    return path.stat().st_mtime_ns if path.exists() else 0
+
+def load_icon_sprite() -> Optional[Dict]:
+    """Manifeste du sprite des logos, ou None s'il n'a pas encore été construit"""
+    version = sprite_version()
+    return build_icon_sprite(version) if version else None
+
+def sprite_css(relative: bool = False) -> str:
+    """Règle CSS commune à toutes les icônes du sprite (émise une fois par page).
+
+    `relative` : règle destinée à une feuille publiée dans STATIC_DIR, où le
+    sprite est référencé par son seul nom (les url() d'un fichier CSS se
+    résolvent par rapport à celui-ci, pas à la page).
+    """
+    sprite = load_icon_sprite()
+    if sprite is None:
+        return ""
+    url = sprite["file"] if relative and "file" in sprite else sprite["url"]
+    return f'.icon-sprite {{ display: inline-block; vertical-align: middle; background-image: url("{url}"); background-repeat: no-repeat; }}'
+
+def icon_html(url: str, size: int) -> str:
+    """Icône découpée dans le sprite local ; l'URL d'origine sert de repli si elle n'y est pas"""
+    sprite = load_icon_sprite()
+    if sprite is None or url not in sprite["icons"]:
+        return f'<img src="{url}" width="{size}" height="{size}">'
+    columns, rows = sprite["columns"], sprite["rows"]
+    x, y = sprite["icons"][url] % columns, sprite["icons"][url] // columns
+    return (f'<span class="icon-sprite" style="width:{size}px;height:{size}px;'
+            f'background-position:-{x * size}px -{y * size}px;'
+            f'background-size:{columns * size}px {rows * size}px"></span>')
+
+# ============================================
+# CACHES EN MÉMOIRE (Performance)
+# ============================================
+class LRUCache:
+    """Cache LRU en mémoire, borné en nombre d'entrées et en octets (mesurés par `sizeof`)"""
+
+    def __init__(self, max_items: int, max_bytes: int, sizeof=len):
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self.size = 0
+        self._items: "OrderedDict[str, object]" = OrderedDict()
+        self._lock = threading.Lock()  # Partagé entre les threads des sessions
+
+    def get(self, key: str):
+        with self._lock:
+            value = self._items.get(key)
+            if value is not None:
+                self._items.move_to_end(key)
+            return value
+
+    def put(self, key: str, value):
+        with self._lock:
+            if key in self._items:
+                self.size -= self.sizeof(self._items.pop(key))
+            self._items[key] = value
+            self.size += self.sizeof(value)
+            while self._items and (len(self._items) > self.max_items or self.size > self.max_bytes):
+                _, evicted = self._items.popitem(last=False)
+                self.size -= self.sizeof(evicted)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self.size = 0
+
+@st.cache_resource
+def get_fragment_cache() -> LRUCache:
+    """Cache des fragments HTML pré-rendus, partagé entre sessions et reruns"""
+    return LRUCache(Config.FRAGMENT_CACHE_MAX_ITEMS, Config.FRAGMENT_CACHE_MAX_BYTES)
+
+def fragment_key(name: str, data) -> str:
+    """Clé de cache : hash des données sources, de la palette, de la version du code et du sprite"""
+    payload = json.dumps([name, data, Config.COLORS, Config.BUILD_ID, sprite_version()],
+                         sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+def cached_fragment(name: str):
+    """Mémoïse le HTML produit par un constructeur pur ; invalidé dès que ses arguments changent"""
+    def decorator(builder):
+        @functools.wraps(builder)
+        def wrapper(*args):
+            cache = get_fragment_cache()
+            key = fragment_key(name, args)
+            html = cache.get(key)
+            if Config.METRICS_ENABLED:
+                get_metrics().count_cache(f"fragment.{name}", miss=html is None)
+            if html is None:
+                html = get_shared_cache().get_or_compute(
+                    f"fragment:{key}", lambda: builder(*args).encode()).decode()
+                cache.put(key, html)
+            return html
+        return wrapper
+    return decorator
+
+# ============================================
+# SERVICE D'IMAGES (dérivés redimensionnés)
+# ============================================
+def resolve_asset(path: str) -> Path:
+    """Chemin d'un asset relatif à Config.BASE_DIR, quel que soit le répertoire courant"""
+    resolved = Path(path)
+    return resolved if resolved.is_absolute() else Config.BASE_DIR / resolved
+
+@st.cache_resource
+def get_image_cache() -> LRUCache:
+    """Dérivés d'images (nom, octets) gardés en mémoire, bornés en octets"""
+    return LRUCache(Config.IMAGE_CACHE_MAX_ITEMS, Config.IMAGE_CACHE_MAX_BYTES, sizeof=lambda item: len(item[1]))
+
+def image_derivative(path: Path, width: int) -> Tuple[str, bytes]:
+    """Version WebP de l'image à `width` px de large : (nom dans STATIC_DIR, octets).
+
+    Mémoire d'abord, puis disque (nom versionné par le hash de la source) ;
+    l'image n'est décodée et ré-encodée qu'en l'absence des deux.
+    """
+    cache = get_image_cache()
+    key = f"{path}:{path.stat().st_mtime_ns}:{width}:{Config.PROFILE_PHOTO_QUALITY}"
+    derivative = cache.get(key)
+    if derivative is None:
+        source = path.read_bytes()
+        name = f"{path.stem}-{content_hash(source)}-{width}q{Config.PROFILE_PHOTO_QUALITY}.webp"
+        target = Config.STATIC_DIR / name
+        if target.exists():
+            data = target.read_bytes()
+        else:
+            shared = shared_key("image", content_hash(source), width, Config.PROFILE_PHOTO_QUALITY)
+            data = get_shared_cache().get_or_compute(
+                shared, lambda: encode_webp(source, width, Config.PROFILE_PHOTO_QUALITY))
+            write_static(name, data)
+        derivative = (name, data)
+        cache.put(key, derivative)
+    return derivative
+
+def responsive_image_html(path: Path, width: int, css_class: str = "") -> str:
+    """Balise <img> 1x/2x (srcset) pointant vers les dérivés publiés dans STATIC_DIR"""
+    url_1x = static_url(image_derivative(path, width)[0])
+    url_2x = static_url(image_derivative(path, width * 2)[0])
+    return f'<img class="{css_class}" src="{url_1x}" srcset="{url_1x} 1x, {url_2x} 2x" width="{width}">'
+
+def responsive_image(path: Path, width: int, css_class: str = ""):
+    """Affiche une image en 1x/2x à partir de ses dérivés en cache (embarquée s'ils ne sont pas publiés)"""
+    names = [image_derivative(path, w)[0] for w in (width, width * 2)]
+    if static_serving_enabled() and all((Config.STATIC_DIR / name).exists() for name in names):
+        emit_html(responsive_image_html(path, width, css_class))
+    else:
+        st.image(image_derivative(path, width * 2)[1], width=width)
+
+# ============================================
+# THÈME (feuille de style unique)
+# ============================================
+def hex_to_rgba(color: str, alpha: float) -> str:
+    """'#00d4ff', 0.1 -> 'rgba(0, 212, 255, 0.1)'"""
+    color = color.lstrip("#")
+    red, green, blue = (int(color[i:i + 2], 16) for i in (0, 2, 4))
+    return f"rgba({red}, {green}, {blue}, {alpha})"
+
+def minify_css(css: str) -> str:
+    """Supprime commentaires et espaces superflus d'une feuille de style"""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,])\s*", r"\1", css)
+    return re.sub(r":\s+", ":", css).replace(";}", "}").strip()
+
+@cached("theme_css", st.cache_data(max_entries=4))
+def build_theme_css(colors: Tuple[Tuple[str, str], ...], extra: str = "") -> str:
+    """Feuille de style minifiée de tous les composants, générée depuis la palette"""
+    c = dict(colors)
+    accent, panel = c["accent"], c["panel"]
+    css = f"""
+    .main-title {{ font-size: 3.5em; font-weight: 800; color: {c['primary']}; text-align: center; margin-bottom: 10px; }}
+    .main-subtitle {{ font-size: 1.2em; color: {accent}; text-align: center; margin-bottom: 40px; letter-spacing: 4px; }}
+    div[role="radiogroup"] {{ justify-content: center; gap: 25px; margin-bottom: 30px; }}
+    div[role="radiogroup"] label p {{ color: {c['light']}; font-weight: 600; }}
+    div[role="radiogroup"] label:has(input:checked) p {{ color: {accent}; border-bottom: 2px solid {accent}; }}
+
+    .pf-title, .pf-subtitle {{ color: {c['primary']}; }}
+    .pf-subtitle {{ margin-top: 30px; }}
+    .pf-panel {{ background: {hex_to_rgba(panel, 0.8)}; border-radius: 15px; padding: 20px; border: 1px solid {hex_to_rgba(accent, 0.2)}; backdrop-filter: blur(10px); }}
+
+    .pf-contact h4 {{ color: {accent}; margin-top: 0; }}
+    .pf-contact p {{ color: {c['light']}; margin-bottom: 5px; }}
+    .pf-contact hr {{ border-color: {hex_to_rgba(accent, 0.1)}; }}
+    .pf-contact .pf-em {{ color: {c['primary']}; }}
+    .pf-contact a {{ color: {accent}; text-decoration: none; }}
+    .pf-name {{ color: {c['primary']}; margin-top: 0; }}
+    .pf-role {{ color: {accent}; }}
+    .pf-summary {{ background: {hex_to_rgba(panel, 0.6)}; border-radius: 15px; padding: 25px; margin-top: 20px; border-left: 5px solid {accent}; color: {c['light']}; line-height: 1.6; }}
+    .pf-photo {{ margin-bottom: 20px; }}
+    .pf-placeholder {{ text-align: center; margin-bottom: 20px; }}
+    .pf-placeholder div {{ display: inline-block; padding: 5px; background: linear-gradient(45deg, {accent}, #ffffff); border-radius: 15px; }}
+    .pf-placeholder img {{ width: 100%; border-radius: 10px; display: block; }}
+
+    .pf-stat {{ background: {hex_to_rgba(accent, 0.1)}; border-radius: 10px; padding: 20px; text-align: center; border: 1px solid {hex_to_rgba(accent, 0.3)}; }}
+    .pf-stat h1 {{ color: {accent}; margin: 0; }}
+    .pf-stat p {{ color: {c['light']}; }}
+
+    .pf-skills {{ padding: 25px; margin-bottom: 20px; }}
+    .pf-skills h3 {{ color: {accent}; margin-top: 0; }}
+    .pf-badges {{ margin-top: 15px; display: flex; flex-wrap: wrap; }}
+    .pf-badge {{ display: inline-flex; align-items: center; background: {hex_to_rgba(accent, 0.1)}; color: {accent}; padding: 5px 12px; border-radius: 20px; margin: 4px; border: 1px solid {hex_to_rgba(accent, 0.3)}; font-size: 0.85em; font-weight: 500; }}
+    .pf-badge img, .pf-badge .icon-sprite {{ margin-right: 8px; }}
+    .pf-bar {{ margin-bottom: 15px; }}
+    .pf-bar-head {{ display: flex; justify-content: space-between; margin-bottom: 5px; color: {c['light']}; font-weight: 500; }}
+    .pf-bar-head b {{ color: {accent}; font-weight: normal; }}
+    .pf-bar-track {{ background: rgba(255, 255, 255, 0.1); height: 8px; border-radius: 4px; overflow: hidden; }}
+    .pf-bar-fill {{ background: linear-gradient(90deg, {accent}, #0099cc); height: 100%; border-radius: 4px; }}
+
+    .pf-exp {{ background: {hex_to_rgba(panel, 0.9)}; border-radius: 10px; padding: 20px; margin-bottom: 20px; border-left: 4px solid {accent}; backdrop-filter: blur(10px); color: {c['light']}; }}
+    .pf-exp-head {{ display: flex; justify-content: space-between; }}
+    .pf-exp h3 {{ color: {c['primary']}; margin: 0; }}
+    .pf-exp h4 {{ color: {accent}; margin: 0; }}
+    .pf-exp .pf-period {{ font-weight: bold; }}
+    .pf-exp p {{ margin: 10px 0; }}
+    .pf-exp .pf-points div {{ margin: 5px 0; }}
+
+    .pf-research, .pf-result {{ background: {hex_to_rgba(panel, 0.8)}; border-radius: 10px; padding: 20px; margin-bottom: 15px; border: 1px solid {hex_to_rgba(accent, 0.1)}; }}
+    .pf-research h4 {{ color: {accent}; margin: 0; }}
+    .pf-research p {{ color: {c['light']}; }}
+    .pf-research .pf-meta {{ color: {c['primary']}; font-style: italic; margin: 5px 0; }}
+    .pf-result {{ padding: 15px 20px; margin-bottom: 10px; }}
+    .pf-result span {{ color: {c['secondary']}; font-size: 0.8em; }}
+    .pf-result h4 {{ color: {accent}; margin: 5px 0; }}
+    .pf-result p {{ color: {c['light']}; margin: 0; }}
+
+    .pf-footer {{ background: {hex_to_rgba(panel, 0.95)}; border-radius: 15px; padding: 40px; margin-top: 50px; text-align: center; border: 1px solid {hex_to_rgba(accent, 0.2)}; }}
+    .pf-footer h3 {{ color: {c['primary']}; }}
+    .pf-footer p {{ color: {c['light']}; }}
+    .pf-social {{ display: flex; justify-content: center; gap: 20px; margin: 20px 0; }}
+    .pf-social img, .pf-social .icon-sprite {{ filter: brightness(0) invert(1); }}
+    """
+    return minify_css(css + extra)
+
+def theme_css(relative: bool = False) -> str:
+    """Feuille de style complète de la page (composants + sprite d'icônes, cf. sprite_css)"""
+    return build_theme_css(tuple(sorted(Config.COLORS.items())), sprite_css(relative))
+
+@cached("page_css", st.cache_data(max_entries=4))
+def build_page_css(css: str, static: bool) -> str:
+    """Balise à injecter : import du fichier versionné (mis en cache par le navigateur) ou CSS en ligne.
+
+    Renvoie une chaîne vide si le fichier versionné n'a pas pu être publié.
+    """
+    if static:
+        name = f"theme-{content_hash(css.encode())}.css"
+        if write_static(name, css.encode()) is None:
+            return ""
+        return f'<style>@import url("{static_url(name)}");</style>'
+    return f"<style>{css}</style>"
+
+def page_css() -> str:
+    """Feuille de style de la page, émise une seule fois par rerun"""
+    if static_serving_enabled():
+        tag = build_page_css(theme_css(relative=True), True)
+        if tag:
+            return tag
+    # Le sprite est alors référencé par son URL complète (ou en data URI), pas relativement à la feuille
+    return build_page_css(theme_css(), False)
 
 # ============================================
 # COMPOSANTS UI (Design)
@@ -228,44 +1169,126 @@ class UIComponents:
     """Composants d'interface réutilisables"""
     
     @staticmethod
+    @cached_fragment("tech_badge")
     def tech_badge(name: str, logo_url: str = "") -> str:
         """Génère un badge technologique stylisé"""
-        logo_html = f'<img src="{logo_url}" style="width: 16px; height: 16px; margin-right: 8px;">' if logo_url else ""
-        return f"""
-        <div style="
-            display: inline-flex;
-            align-items: center;
-            background: rgba(0, 212, 255, 0.1);
-            color: {Config.COLORS['accent']};
-            padding: 5px 12px;
-            border-radius: 20px;
-            margin: 4px;
-            border: 1px solid rgba(0, 212, 255, 0.3);
-            font-size: 0.85em;
-            font-weight: 500;
-        ">
-            {logo_html}{name}
-        </div>
-        """
+        logo_html = icon_html(logo_url, 16) if logo_url else ""
+        return f'<span class="pf-badge">{logo_html}{name}</span>'
 
     @staticmethod
     def skill_bar(name: str, level: int):
         """Affiche une barre de compétence avec animation CSS"""
-        st.markdown(f"""
-        <div style="margin-bottom: 15px;">
-            <div style="display: flex; justify-content: space-between; margin-bottom: 5px;">
-                <span style="color: {Config.COLORS['light']}; font-weight: 500;">{name}</span>
-                <span style="color: {Config.COLORS['accent']};">{level}%</span>
-            </div>
-            <div style="background: rgba(255, 255, 255, 0.1); height: 8px; border-radius: 4px; overflow: hidden;">
-                <div style="background: linear-gradient(90deg, {Config.COLORS['accent']}, #0099cc); width: {level}%; height: 100%; border-radius: 4px;"></div>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+        emit_html(
+            f'<div class="pf-bar"><div class="pf-bar-head"><span>{name}</span><b>{level}%</b></div>'
+            f'<div class="pf-bar-track"><div class="pf-bar-fill" style="width: {level}%"></div></div></div>'
+        )
+
+    @staticmethod
+    @cached_fragment("stat_card")
+    def stat_card(value: str, label: str) -> str:
+        """Génère une carte de statistique"""
+        return f'<div class="pf-stat"><h1>{value}</h1><p>{label}</p></div>'
+
+# ============================================
+# FRAGMENTS DES SECTIONS (HTML pur, mis en cache)
+# ============================================
+@cached_fragment("contact_card")
+def build_contact_card(personal: Dict) -> str:
+    """Carte de contact de la section ABOUT ME"""
+    return (
+        f'<div class="pf-panel pf-contact"><h4>📍 Contact</h4>'
+        f'<p><strong>Email:</strong> {personal["email"]}</p>'
+        f'<p><strong>Tel:</strong> {personal["phone"]}</p>'
+        f'<p><strong>Lieu:</strong> {personal["location"]}</p><hr>'
+        f'<p><strong class="pf-em">🌐 Portfolio:</strong><br>'
+        f'<a href="https://github.com/Thekidmaroi" target="_blank">github.com/Thekidmaroi</a></p></div>'
+    )
+
+@cached_fragment("profile_header")
+def build_profile_header(personal: Dict) -> str:
+    """Nom, titre et résumé de la section ABOUT ME"""
+    return (
+        f'<h2 class="pf-name">{personal["name"]}</h2>'
+        f'<h4 class="pf-role">{personal["title"]}</h4>'
+        f'<div class="pf-summary">{personal["summary"]}</div>'
+    )
+
+def build_stat_cards(stats: Dict) -> List[str]:
+    """Cartes de statistiques de la section ABOUT ME, dans l'ordre d'affichage"""
+    return [
+        UIComponents.stat_card(f"{stats['projects']}+", "Projets"),
+        UIComponents.stat_card(f"{stats['years_exp']}+", "Années"),
+        UIComponents.stat_card(f"{stats['technologies']}", "Techs"),
+        UIComponents.stat_card(f"{stats['models']}+", "Modèles"),
+    ]
+
+def group_skills(technical: Dict) -> Dict[str, List]:
+    """Regroupe les compétences techniques par catégorie (ordre d'apparition conservé)"""
+    categories = {}
+    for skill, data in technical.items():
+        categories.setdefault(data["category"], []).append((skill, data))
+    return categories
+
+@cached_fragment("skill_category")
+def build_skill_category_card(category: str, skills: List) -> str:
+    """Carte d'une catégorie de compétences avec ses badges"""
+    badges = "".join(UIComponents.tech_badge(s[0], s[1]["logo"]) for s in skills)
+    return f'<div class="pf-panel pf-skills"><h3>{category}</h3><div class="pf-badges">{badges}</div></div>'
+
+@cached_fragment("experience_card")
+def build_experience_card(exp: Dict) -> str:
+    """Carte d'une expérience professionnelle"""
+    points = "".join(f"<div>• {a}</div>" for a in exp["achievements"])
+    return (
+        f'<div class="pf-exp"><div class="pf-exp-head">'
+        f'<div><h3>{exp["position"]}</h3><h4>{exp["company"]}</h4></div>'
+        f'<div class="pf-period">{exp["period"]}</div></div>'
+        f'<p>{exp["description"]}</p><div class="pf-points">{points}</div></div>'
+    )
+
+@cached_fragment("experience_section")
+def build_experience_html(experience_data: List[Dict]) -> str:
+    """HTML complet de la liste des expériences"""
+    return "".join(build_experience_card(exp) for exp in experience_data)
+
+@cached_fragment("research_card")
+def build_research_card(item: Dict) -> str:
+    """Carte d'une publication"""
+    return (
+        f'<div class="pf-research"><h4>{item["title"]}</h4>'
+        f'<p class="pf-meta">{item["journal"]} - <strong>{item["status"]}</strong></p>'
+        f'<p>{item["description"]}</p></div>'
+    )
+
+@cached_fragment("research_section")
+def build_research_html(research: List[Dict]) -> str:
+    """HTML complet de la liste des publications"""
+    return "".join(build_research_card(item) for item in research)
+
+@cached_fragment("footer")
+def build_footer_html(social: Dict, year: int) -> str:
+    """Pied de page avec les liens sociaux"""
+    links = " ".join(f'<a href="{d["url"]}" target="_blank">{icon_html(d["icon"], 40)}</a>' for d in social.values())
+    return (
+        f'<div class="pf-footer"><h3>🔗 Connectons-nous</h3><div class="pf-social">{links}</div>'
+        f'<p>© {year} Marwane Houngnon. Tous droits réservés.</p></div>'
+    )
 
 # ============================================
 # SECTIONS DE L'APPLICATION
 # ============================================
+SECTION_TITLES = {
+    "what-i-do": "🛠️ Expertise Technique & Stack",
+    "experience": "💼 Mon Parcours Professionnel",
+    "projects": "🚀 Mes Projets",
+    "research": " Projets de Recherche & Publications",
+    "search": "🔎 Rechercher",
+}
+
+def section_title(slug: str) -> str:
+    """Titre <h2> d'une section"""
+    return f'<h2 class="pf-title">{SECTION_TITLES[slug]}</h2>'
+
 def render_about_section():
     """Affiche la section ABOUT ME"""
     profile_data = load_profile_data()
@@ -276,101 +1299,114 @@ def render_about_section():
     
     with col1:
         # Photo de profil
-        if os.path.exists(personal['photo']):
-                       st.image(personal['photo'], width=200) # Changez 200 selon vos préférences
-
+        photo = resolve_asset(personal['photo'])
+        if photo.exists():
+            responsive_image(photo, Config.PROFILE_PHOTO_WIDTH, "pf-photo")
         else:
-            st.markdown(f"""
-            <div style="text-align: center; margin-bottom: 20px;">
-                <div style="display: inline-block; padding: 5px; background: linear-gradient(45deg, {Config.COLORS['accent']}, #ffffff); border-radius: 15px;">
-                    <img src="https://via.placeholder.com/300" style="width: 100%; border-radius: 10px; display: block;">
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
+            emit_html('<div class="pf-placeholder"><div><img src="https://via.placeholder.com/300"></div></div>')
         
         # Informations de contact
-        st.markdown(f"""
-        <div style="background: rgba(15, 23, 42, 0.8); border-radius: 15px; padding: 20px; border: 1px solid rgba(0, 212, 255, 0.2); backdrop-filter: blur(10px);">
-            <h4 style="color: {Config.COLORS['accent']}; margin-top: 0;">📍 Contact</h4>
-            <p style="color: {Config.COLORS['light']}; margin-bottom: 5px;"><strong>Email:</strong> {personal['email']}</p>
-            <p style="color: {Config.COLORS['light']}; margin-bottom: 5px;"><strong>Tel:</strong> {personal['phone']}</p>
-            <p style="color: {Config.COLORS['light']}; margin-bottom: 5px;"><strong>Lieu:</strong> {personal['location']}</p>
-            <hr style="border-color: rgba(0, 212, 255, 0.1);">
-            <p style="color: {Config.COLORS['light']};">
-                <strong style="color: {Config.COLORS['primary']};">🌐 Portfolio:</strong><br>
-                <a href="https://github.com/Thekidmaroi" style="color: {Config.COLORS['accent']}; text-decoration: none;" target="_blank">github.com/Thekidmaroi</a>
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
+        emit_html(build_contact_card(personal))
     
     with col2:
-        st.markdown(f"<h2 style='color: {Config.COLORS['primary']}; margin-top: 0;'>{personal['name']}</h2>", unsafe_allow_html=True)
-        st.markdown(f"<h4 style='color: {Config.COLORS['accent']};'>{personal['title']}</h4>", unsafe_allow_html=True)
-        
-        st.markdown(f"""
-        <div style="background: rgba(15, 23, 42, 0.6); border-radius: 15px; padding: 25px; margin-top: 20px; border-left: 5px solid {Config.COLORS['accent']}; color: {Config.COLORS['light']}; line-height: 1.6;">
-            {personal['summary']}
-        </div>
-        """, unsafe_allow_html=True)
+        emit_html(build_profile_header(personal))
         
         # Statistiques
-        st.markdown(f"<h3 style='color: {Config.COLORS['primary']}; margin-top: 30px;'>📈 Mes Statistiques Data Science</h3>", unsafe_allow_html=True)
-        c1, c2, c3, c4 = st.columns(4)
-        with c1: st.markdown(f'<div style="background: rgba(0, 212, 255, 0.1); border-radius: 10px; padding: 20px; text-align: center; border: 1px solid rgba(0, 212, 255, 0.3);"><h1 style="color: {Config.COLORS["accent"]}; margin: 0;">{stats["projects"]}+</h1><p style="color: {Config.COLORS["light"]};">Projets</p></div>', unsafe_allow_html=True)
-        with c2: st.markdown(f'<div style="background: rgba(0, 212, 255, 0.1); border-radius: 10px; padding: 20px; text-align: center; border: 1px solid rgba(0, 212, 255, 0.3);"><h1 style="color: {Config.COLORS["accent"]}; margin: 0;">{stats["years_exp"]}+</h1><p style="color: {Config.COLORS["light"]};">Années</p></div>', unsafe_allow_html=True)
-        with c3: st.markdown(f'<div style="background: rgba(0, 212, 255, 0.1); border-radius: 10px; padding: 20px; text-align: center; border: 1px solid rgba(0, 212, 255, 0.3);"><h1 style="color: {Config.COLORS["accent"]}; margin: 0;">{stats["technologies"]}</h1><p style="color: {Config.COLORS["light"]};">Techs</p></div>', unsafe_allow_html=True)
-        with c4: st.markdown(f'<div style="background: rgba(0, 212, 255, 0.1); border-radius: 10px; padding: 20px; text-align: center; border: 1px solid rgba(0, 212, 255, 0.3);"><h1 style="color: {Config.COLORS["accent"]}; margin: 0;">{stats["models"]}+</h1><p style="color: {Config.COLORS["light"]};">Modèles</p></div>', unsafe_allow_html=True)
+        emit_html('<h3 class="pf-subtitle">📈 Mes Statistiques Data Science</h3>')
+        for column, card in zip(st.columns(4), build_stat_cards(stats)):
+            with column: emit_html(card)
 
 def render_what_i_do_section():
     """Affiche la section WHAT I DO"""
     skills_data = load_skills_data()
-    st.markdown(f"<h2 style='color: {Config.COLORS['primary']};'>🛠️ Expertise Technique & Stack</h2>", unsafe_allow_html=True)
-    
-    categories = {}
-    for skill, data in skills_data["technical"].items():
-        cat = data["category"]
-        if cat not in categories: categories[cat] = []
-        categories[cat].append((skill, data))
+    emit_html(section_title("what-i-do"))
     
+    categories = group_skills(skills_data["technical"])
     cat_cols = st.columns(2)
     for idx, (category, skills) in enumerate(categories.items()):
         with cat_cols[idx % 2]:
-            st.markdown(f"""
-            <div style="background: rgba(15, 23, 42, 0.8); border-radius: 15px; padding: 25px; margin-bottom: 20px; border: 1px solid rgba(0, 212, 255, 0.2); backdrop-filter: blur(10px);">
-                <h3 style="color: {Config.COLORS['accent']}; margin-top: 0;">{category}</h3>
-                <div style="margin-top: 15px; display: flex; flex-wrap: wrap;">
-                    {" ".join([UIComponents.tech_badge(s[0], s[1]["logo"]) for s in skills])}
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
+            emit_html(build_skill_category_card(category, skills))
+
+    render_skills_analytics()
+
+def render_skills_analytics():
+    """Graphiques d'analyse des compétences (figures pré-calculées en cache)"""
+    emit_html('<h3 class="pf-subtitle">📊 Analyse des compétences</h3>')
+    figures = build_skills_figures(data_version("skills"), data_version("projects"), datetime.now().year)
+    for row in (("radar", "levels"), ("timeline", "usage")):
+        for column, name in zip(st.columns(2), row):
+            with column:
+                st.plotly_chart(figures[name], width="stretch", key=f"skills_{name}")
+
+def iter_batches(records: Iterable, size: int) -> Iterator[List]:
+    """Découpe un flux d'enregistrements en lots d'au plus `size` éléments"""
+    iterator = iter(records)
+    while batch := list(itertools.islice(iterator, size)):
+        yield batch
+
+def _show_more(key: str, step: int):
+    """Bouton "Afficher plus" : élargit la fenêtre affichée d'un lot"""
+    st.session_state[key] += step
+
+def stream_cards(name: str, records: Sequence[Dict], build_card: Callable[[Dict], str]):
+    """Affiche des cartes par lots au fil d'un générateur sur les données.
+
+    Chaque lot est un bloc markdown distinct, envoyé au navigateur dès qu'il
+    est construit : le premier écran s'affiche sans attendre les suivants et
+    seul le HTML du lot courant est gardé en mémoire. Au-delà de la fenêtre
+    (session_state["<name>_shown"]), un bouton charge le lot suivant ; la
+    section étant un fragment, seul celui-ci est réexécuté.
+    """
+    key = f"{name}_shown"
+    if Config.STREAM_BATCH_SIZE:
+        batch_size = Config.STREAM_BATCH_SIZE
+        shown = st.session_state.setdefault(key, batch_size)
+    else:
+        batch_size = shown = max(len(records), 1)
+    for batch in iter_batches(itertools.islice(records, shown), batch_size):
+        emit_html("".join(build_card(record) for record in batch))
+    if shown < len(records):
+        st.caption(f"{shown} / {len(records)}")
+        st.button("Afficher plus", key=f"{name}_more", on_click=_show_more, args=(key, batch_size))
 
 def render_experience_section():
     """Affiche la section MY EXPERIENCE"""
-    experience_data = load_experience_data()
-    st.markdown(f"<h2 style='color: {Config.COLORS['primary']};'>💼 Mon Parcours Professionnel</h2>", unsafe_allow_html=True)
-    
-    for exp in experience_data:
-        st.markdown(f"""
-        <div style="background: rgba(15, 23, 42, 0.9); border-radius: 10px; padding: 20px; margin-bottom: 20px; border-left: 4px solid {Config.COLORS['accent']}; backdrop-filter: blur(10px);">
-            <div style="display: flex; justify-content: space-between;">
-                <div>
-                    <h3 style="color: {Config.COLORS['primary']}; margin: 0;">{exp['position']}</h3>
-                    <h4 style="color: {Config.COLORS['accent']}; margin: 0;">{exp['company']}</h4>
-                </div>
-                <div style="color: {Config.COLORS['light']}; font-weight: bold;">{exp['period']}</div>
-            </div>
-            <p style="color: {Config.COLORS['light']}; margin: 10px 0;">{exp['description']}</p>
-            <div style="color: {Config.COLORS['light']};">
-                {"".join([f"<div style='margin: 5px 0;'>• {a}</div>" for a in exp['achievements']])}
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+    emit_html(section_title("experience"))
+    stream_cards("experience", load_experience_data(), build_experience_card)
+
+def _reset_projects_page():
+    """Revient à la première page quand les filtres changent"""
+    st.session_state["projects_page"] = 1
 
 def render_projects_section():
-    """Affiche la section MY PROJECTS"""
+    """Affiche la section MY PROJECTS (filtres et pagination côté serveur)"""
+    version = data_version("projects")
+    indexes = load_project_indexes()
+    emit_html(section_title("projects"))
+
+    f1, f2, f3, f4 = st.columns(4)
+    filters = (
+        ("category", tuple(f1.multiselect("Catégorie", sorted(indexes["category"]), key="projects_category", on_change=_reset_projects_page))),
+        ("year", tuple(f2.multiselect("Année", sorted(indexes["year"], reverse=True), key="projects_year", on_change=_reset_projects_page))),
+        ("client", tuple(f3.multiselect("Client", sorted(indexes["client"]), key="projects_client", on_change=_reset_projects_page))),
+        ("technology", tuple(f4.multiselect("Technologie", sorted(indexes["technology"]), key="projects_technology", on_change=_reset_projects_page))),
+    )
+    positions = filter_projects(version, filters)
+
+    page_size = Config.PROJECTS_PAGE_SIZE
+    page_count = max(1, -(-len(positions) // page_size))
+    if st.session_state.get("projects_page", 1) > page_count:
+        st.session_state["projects_page"] = 1
+    if page_count > 1:
+        page = st.number_input(f"Page (sur {page_count})", min_value=1, max_value=page_count, step=1, key="projects_page")
+    else:
+        page = 1
+    st.caption(f"{len(positions)} projet(s)")
+
+    # Seule la page courante est transformée en widgets
     projects = load_projects_data()
-    st.markdown(f"<h2 style='color: {Config.COLORS['primary']};'>🚀 Mes Projets</h2>", unsafe_allow_html=True)
-    for project in projects:
+    for position in positions[(page - 1) * page_size:page * page_size]:
+        project = projects[position]
         with st.expander(f"{project['title']} - {project['category']}"):
             st.write(project['description'])
             st.markdown("**Technologies:** " + ", ".join(project['technologies']))
@@ -378,76 +1414,114 @@ def render_projects_section():
 
 def render_research_section():
     """Affiche la section RESEARCH PROJECTS"""
-    research = load_research_data()
-    st.markdown(f"<h2 style='color: {Config.COLORS['primary']};'> Projets de Recherche & Publications</h2>", unsafe_allow_html=True)
-    for item in research:
-        st.markdown(f"""
-        <div style="background: rgba(15, 23, 42, 0.8); border-radius: 10px; padding: 20px; margin-bottom: 15px; border: 1px solid rgba(0, 212, 255, 0.1);">
-            <h4 style="color: {Config.COLORS['accent']}; margin: 0;">{item['title']}</h4>
-            <p style="color: {Config.COLORS['primary']}; font-style: italic; margin: 5px 0;">{item['journal']} - <strong>{item['status']}</strong></p>
-            <p style="color: {Config.COLORS['light']};">{item['description']}</p>
-        </div>
-        """, unsafe_allow_html=True)
+    emit_html(section_title("research"))
+    stream_cards("research", load_research_data(), build_research_card)
+
+SEARCH_KIND_LABELS = {"projects": "Projet", "research": "Publication", "experience": "Expérience"}
+
+def _on_search_change():
+    """Reporte la requête dans l'URL (?q=...)"""
+    st.query_params["q"] = st.session_state["search_query"]
+
+def render_search_section():
+    """Affiche la section SEARCH"""
+    emit_html(section_title("search"))
+    if "search_query" not in st.session_state:
+        st.session_state["search_query"] = st.query_params.get("q", "")
+    query = st.text_input("Recherche", placeholder="LLM, Markov, Docker...", key="search_query",
+                          on_change=_on_search_change, label_visibility="collapsed")
+    if not query.strip():
+        return
+    results = load_search_index().search(query, Config.SEARCH_MAX_RESULTS)
+    st.caption(f"{len(results)} résultat(s)")
+    for doc, score in results:
+        emit_html(
+            f'<div class="pf-result"><span>{SEARCH_KIND_LABELS[doc["kind"]]} · score {score:.2f}</span>'
+            f'<h4>{doc["title"]}</h4><p>{doc["snippet"]}</p></div>'
+        )
+
+# ============================================
+# NAVIGATION (rendu paresseux des sections)
+# ============================================
+# slug d'URL -> (libellé, fonction de rendu, chargeurs à préchauffer)
+SECTIONS = {
+    "about": ("ABOUT ME", render_about_section, (load_profile_data,)),
+    "what-i-do": ("WHAT I DO", render_what_i_do_section, (load_skills_data,)),
+    "experience": ("MY EXPERIENCE", render_experience_section, (load_experience_data,)),
+    "projects": ("MY PROJECTS", render_projects_section, (load_projects_data,)),
+    "research": ("RESEARCH PROJECTS", render_research_section, (load_research_data,)),
+    # Index construit à la première recherche : NumPy n'est pas importé pour les autres pages
+    "search": ("SEARCH", render_search_section, ()),
+}
+DEFAULT_SECTION = "about"
+
+def get_active_section() -> str:
+    """Section demandée dans l'URL (?section=...), avec repli sur la section par défaut"""
+    section = st.query_params.get("section", DEFAULT_SECTION)
+    return section if section in SECTIONS else DEFAULT_SECTION
+
+def _on_section_change():
+    """Reporte la section choisie dans l'URL pour les liens directs"""
+    st.query_params["section"] = st.session_state["nav_section"]
+
+def render_navigation() -> str:
+    """Barre de navigation entre sections, synchronisée avec les paramètres d'URL"""
+    if "nav_section" not in st.session_state:
+        st.session_state["nav_section"] = get_active_section()
+    return st.radio(
+        "Navigation",
+        list(SECTIONS),
+        format_func=lambda slug: SECTIONS[slug][0],
+        horizontal=True,
+        label_visibility="collapsed",
+        key="nav_section",
+        on_change=_on_section_change,
+    )
+
+def render_active_section(section: str):
+    """Affiche uniquement la section active, dans un fragment pour isoler ses reruns"""
+    renderer = SECTIONS[section][1]
+
+    @st.fragment
+    @functools.wraps(renderer)
+    def fragment():
+        with span(f"section.{section}"):
+            renderer()
+
+    fragment()
+
+def prefetch_sections(active: str):
+    """Préchauffe le cache des autres sections une fois la section visible envoyée"""
+    for slug, (_, _, loaders) in SECTIONS.items():
+        if slug != active:
+            for loader in loaders:
+                loader()
 
 def main():
     """Fonction principale"""
     st.set_page_config(page_title=Config.PAGE_TITLE, page_icon=Config.PAGE_ICON, layout=Config.LAYOUT)
     
-    # Background Image CSS
-    bg_img_path = "image de fond.png"
-    if os.path.exists(bg_img_path):
-        with open(bg_img_path, "rb") as f:
-            data = base64.b64encode(f.read()).decode()
-        st.markdown(f"""
-        <style>
-        .stApp {{
-            background-image: url("data:image/png;base64,{data}");
-            background-size: cover;
-            background-attachment: fixed;
-        }}
-        .stApp::before {{
-            content: "";
-            position: fixed;
-            top: 0; left: 0; width: 100%; height: 100%;
-            background: {Config.COLORS['overlay']};
-            backdrop-filter: blur(80px);
-            z-index: -1;
-        }}
-        </style>
-        """, unsafe_allow_html=True)
-
-    st.markdown(f"""
-    <style>
-    .main-title {{ font-size: 3.5em; font-weight: 800; color: {Config.COLORS['primary']}; text-align: center; margin-bottom: 10px; }}
-    .main-subtitle {{ font-size: 1.2em; color: {Config.COLORS['accent']}; text-align: center; margin-bottom: 40px; letter-spacing: 4px; }}
-    .stTabs [data-baseweb="tab"] {{ color: {Config.COLORS['light']}; font-weight: 600; }}
-    .stTabs [aria-selected="true"] {{ color: {Config.COLORS['accent']} !important; border-bottom: 2px solid {Config.COLORS['accent']} !important; }}
-    </style>
-    """, unsafe_allow_html=True)
-    
-    st.markdown('<div class="main-title">MY PORTFOLIO</div>', unsafe_allow_html=True)
-    st.markdown('<div class="main-subtitle">Data Science • Machine Learning • Artificial Intelligence</div>', unsafe_allow_html=True)
-    
-    tab1, tab2, tab3, tab4, tab5 = st.tabs(["ABOUT ME", "WHAT I DO", "MY EXPERIENCE", "MY PROJECTS", "RESEARCH PROJECTS"])
-    
-    with tab1: render_about_section()
-    with tab2: render_what_i_do_section()
-    with tab3: render_experience_section()
-    with tab4: render_projects_section()
-    with tab5: render_research_section()
-    
-    # Footer
-    profile_data = load_profile_data()
-    social = profile_data["social"]
-    st.markdown(f"""
-    <div style="background: rgba(15, 23, 42, 0.95); border-radius: 15px; padding: 40px; margin-top: 50px; text-align: center; border: 1px solid rgba(0, 212, 255, 0.2);">
-        <h3 style='color: {Config.COLORS['primary']};'>🔗 Connectons-nous</h3>
-        <div style="display: flex; justify-content: center; gap: 20px; margin: 20px 0;">
-            {" ".join([f'<a href="{d["url"]}" target="_blank"><img src="{d["icon"]}" width="40" style="filter: brightness(0) invert(1);"></a>' for p, d in social.items()])}
-        </div>
-        <p style="color: {Config.COLORS['light']};">© {datetime.now().year} Marwane Houngnon. Tous droits réservés.</p>
-    </div>
-    """, unsafe_allow_html=True)
+    with span("rerun"):
+        # Background Image CSS (variantes WebP servies en fichiers statiques)
+        with span("background"):
+            if Config.BACKGROUND_IMAGE.exists():
+                emit_html(background_css(Config.BACKGROUND_IMAGE.stat().st_mtime_ns))
+
+        emit_html(page_css())
+        
+        emit_html('<div class="main-title">MY PORTFOLIO</div>')
+        emit_html('<div class="main-subtitle">Data Science • Machine Learning • Artificial Intelligence</div>')
+        
+        section = render_navigation()
+        render_active_section(section)
+        with span("prefetch"):
+            prefetch_sections(section)
+        
+        # Footer
+        emit_html(build_footer_html(load_profile_data()["social"], datetime.now().year))
+
+    if Config.METRICS_ENABLED:
+        get_metrics().maybe_flush()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
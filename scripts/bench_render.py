@@ -0,0 +1,179 @@
+"""
+Benchmark de rendu headless (streamlit.testing AppTest).
+
+Pour chaque cible — main() ouvert sur chacune des sections, puis chaque
+render_*_section seule — mesure, cache froid puis cache chaud :
+- le temps mur d'un rerun,
+- le pic mémoire Python alloué pendant le rerun (tracemalloc, lors d'un
+  rerun distinct : le traçage ralentit fortement l'exécution et fausserait
+  le temps mur),
+- le volume de markdown/HTML émis et le nombre de blocs markdown.
+
+Chaque phase retient la médiane de plusieurs mesures (--cold-runs sessions
+neuves à cache vidé, --runs reruns à chaud). Le rapport JSON contient
+toutes les mesures ; seules celles qui ne dépendent pas de la machine
+(markdown_bytes, markdown_blocks) sont enregistrées dans la référence
+(benchmarks/baseline.json) et comparées. Le script sort avec le code 1 en
+cas de régression au-delà des tolérances.
+
+Usage :
+    python scripts/bench_render.py [--runs 5] [--cold-runs 3] [--report benchmarks/report.json]
+    python scripts/bench_render.py --update-baseline
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.append(str(BASE_DIR))
+
+from app import SECTIONS  # noqa: E402
+
+BENCH_DIR = BASE_DIR / "benchmarks"
+# Mesures comparées à la référence -> hausse relative tolérée. Temps et mémoire
+# varient d'une machine à l'autre : ils sont rapportés, pas comparés.
+TOLERANCES = {"markdown_bytes": 0.05, "markdown_blocks": 0.0}
+
+SECTION_SCRIPT = """
+import sys
+sys.path.insert(0, {base_dir!r})
+import app
+app.{function}()
+"""
+
+
+def targets():
+    """Nom -> fabrique d'AppTest prêt à être exécuté"""
+    def main_on(slug):
+        def factory():
+            at = AppTest.from_file(str(BASE_DIR / "app.py"), default_timeout=120)
+            at.query_params["section"] = slug
+            return at
+        return factory
+
+    def section(function):
+        script = SECTION_SCRIPT.format(base_dir=str(BASE_DIR), function=function)
+        return lambda: AppTest.from_string(script, default_timeout=120)
+
+    found = {f"main[{slug}]": main_on(slug) for slug in SECTIONS}
+    for slug, (_, renderer, _) in SECTIONS.items():
+        found[renderer.__name__] = section(renderer.__name__)
+    return found
+
+
+def rerun(at):
+    at.run()
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+
+
+def timed(at):
+    """Rerun chronométré (sans traçage mémoire) et volume émis"""
+    start = time.perf_counter()
+    rerun(at)
+    return {
+        "wall_ms": (time.perf_counter() - start) * 1000,
+        "markdown_bytes": sum(len(m.value.encode()) for m in at.markdown),
+        "markdown_blocks": len(at.markdown),
+    }
+
+
+def traced(at):
+    """Rerun sous tracemalloc : pic mémoire (Ko) alloué pendant le rerun"""
+    tracemalloc.start()
+    try:
+        rerun(at)
+        return tracemalloc.get_traced_memory()[1] / 1024
+    finally:
+        tracemalloc.stop()
+
+
+def clear_caches():
+    st.cache_data.clear()
+    st.cache_resource.clear()
+
+
+def median_of(runs):
+    return {key: statistics.median(run[key] for run in runs) for key in runs[0]}
+
+
+def bench(factory, runs, cold_runs):
+    """Médianes cache froid (caches vidés, nouvelle session à chaque mesure) et cache chaud (reruns).
+
+    Le pic mémoire est mesuré par des reruns supplémentaires, après ceux
+    qui sont chronométrés.
+    """
+    cold, warm = [], []
+    for _ in range(cold_runs):
+        clear_caches()
+        cold.append(timed(factory()))
+        clear_caches()
+        cold[-1]["peak_kb"] = traced(factory())
+    at = factory()
+    rerun(at)
+    for _ in range(runs):
+        warm.append(timed(at))
+        warm[-1]["peak_kb"] = traced(at)
+    return {"cold": median_of(cold), "warm": median_of(warm)}
+
+
+def compare(report, baseline):
+    """Liste des régressions par rapport à la référence"""
+    regressions = []
+    for name, phases in report["results"].items():
+        for phase, metrics in phases.items():
+            reference = baseline.get("results", {}).get(name, {}).get(phase)
+            if not reference:
+                continue
+            for key, tolerance in TOLERANCES.items():
+                if key in reference and metrics[key] > reference[key] * (1 + tolerance):
+                    regressions.append(f"{name} {phase} {key}: {metrics[key]:.1f} > {reference[key]:.1f} (+{tolerance:.0%})")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="reruns à chaud par cible")
+    parser.add_argument("--cold-runs", type=int, default=3, help="sessions neuves (cache vidé) par cible")
+    parser.add_argument("--report", type=Path, default=BENCH_DIR / "report.json")
+    parser.add_argument("--baseline", type=Path, default=BENCH_DIR / "baseline.json")
+    parser.add_argument("--update-baseline", action="store_true", help="enregistre ce rapport comme référence")
+    args = parser.parse_args()
+
+    results = {}
+    for name, factory in targets().items():
+        results[name] = bench(factory, args.runs, args.cold_runs)
+        cold, warm = results[name]["cold"], results[name]["warm"]
+        print(f"{name:32} froid {cold['wall_ms']:7.1f} ms {cold['markdown_bytes']:9d} o | "
+              f"chaud {warm['wall_ms']:7.1f} ms {warm['peak_kb']:8.0f} Ko {warm['markdown_bytes']:9.0f} o")
+    report = {"python": platform.python_version(), "streamlit": st.__version__, "runs": args.runs,
+              "cold_runs": args.cold_runs, "results": results}
+    args.report.parent.mkdir(parents=True, exist_ok=True)
+    args.report.write_text(json.dumps(report, indent=2) + "\n")
+    if args.update_baseline:
+        stable = {name: {phase: {key: metrics[key] for key in TOLERANCES} for phase, metrics in phases.items()}
+                  for name, phases in results.items()}
+        args.baseline.write_text(json.dumps({"results": stable}, indent=2) + "\n")
+        print(f"référence mise à jour : {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"pas de référence ({args.baseline}) : relancer avec --update-baseline")
+        return 0
+    regressions = compare(report, json.loads(args.baseline.read_text()))
+    for line in regressions:
+        print(f"RÉGRESSION {line}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+"""
+Prépare les assets statiques avant un déploiement.
+
+1. Publie dans Config.STATIC_DIR tout ce que la page référence, sous des noms
+   versionnés par le hash du contenu : variantes WebP de l'image de fond,
+   dérivés 1x/2x de la photo de profil, feuille de style du thème, sprite des
+   icônes construit par scripts/build_icons.py. Un sprite absent ou
+   incomplet est une erreur (les logos seraient chargés depuis les CDN,
+   donc indisponibles hors ligne), sauf avec --allow-remote-icons ; les
+   logos remplacés par un monogramme sont seulement signalés.
+2. Pré-calcule les variantes .gz et .br (module brotli facultatif) des
+   fichiers texte qui n'en ont pas encore.
+
+Ces fichiers sont ensuite servis avec ETag et cache immuable par
+scripts/serve_static.py ; l'application les utilise dès le premier rendu
+sans rien encoder.
+
+Usage : python scripts/build_assets.py [--allow-remote-icons]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+import streamlit.logger
+
+# Appels hors d'une session Streamlit : avertissements attendus, rendus muets
+streamlit.logger.set_log_level("error")
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.append(str(BASE_DIR))
+
+from app import (  # noqa: E402
+    Config,
+    build_background_variants,
+    build_page_css,
+    image_derivative,
+    load_icon_sprite,
+    load_profile_data,
+    precompress,
+    resolve_asset,
+    theme_css,
+)
+from build_icons import icon_urls  # noqa: E402
+
+
+def publish():
+    """Génère les fichiers versionnés référencés par la page"""
+    Config.STATIC_SERVING = True
+    if Config.BACKGROUND_IMAGE.exists():
+        build_background_variants(Config.BACKGROUND_IMAGE.stat().st_mtime_ns)
+    photo = resolve_asset(load_profile_data()["personal"]["photo"])
+    if photo.exists():
+        for width in (Config.PROFILE_PHOTO_WIDTH, Config.PROFILE_PHOTO_WIDTH * 2):
+            image_derivative(photo, width)
+    sprite = load_icon_sprite()
+    build_page_css(theme_css(relative=True), True)
+    return sprite
+
+
+def missing_icons(sprite):
+    """Logos référencés par les données mais absents du sprite"""
+    packed = sprite["icons"] if sprite else {}
+    return [url for url in icon_urls() if url not in packed]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--allow-remote-icons", action="store_true",
+                        help="accepte un sprite absent ou incomplet (logos servis par les CDN)")
+    args = parser.parse_args()
+
+    sprite = publish()
+    missing = missing_icons(sprite)
+    if missing:
+        print(f"{len(missing)} logo(s) hors du sprite, lancer scripts/build_icons.py :", file=sys.stderr)
+        for url in missing:
+            print(f"  {url}", file=sys.stderr)
+        if not args.allow_remote_icons:
+            return 1
+    monograms = sprite.get("monograms", []) if sprite else []
+    if monograms:
+        print(f"{len(monograms)} logo(s) remplacé(s) par un monogramme, relancer scripts/build_icons.py en ligne",
+              file=sys.stderr)
+    variants = (".gz", ".br")
+    for path in sorted(Config.STATIC_DIR.iterdir()):
+        if path.suffix not in Config.STATIC_COMPRESSIBLE:
+            continue
+        if not all(path.with_name(path.name + suffix).exists() for suffix in variants):
+            precompress(path)
+
+    for path in sorted(Config.STATIC_DIR.iterdir()):
+        if path.name.startswith(".") or path.suffix in variants:
+            continue
+        sizes = [f"{path.stat().st_size:>9} o"]
+        for suffix in variants:
+            variant = path.with_name(path.name + suffix)
+            if variant.exists():
+                sizes.append(f"{suffix} {variant.stat().st_size:>8} o")
+        print(f"{path.name:40} {'  '.join(sizes)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,160 @@
+"""
+Construit le sprite local des logos (compétences et réseaux sociaux).
+
+1. Télécharge une fois chaque logo référencé dans assets/data (skills.json,
+   profile.json) vers Config.ICONS_DIR/src ; les fichiers déjà présents sont
+   réutilisés, ce qui permet une reconstruction hors ligne.
+   Un logo impossible à télécharger est remplacé par un monogramme (initiales
+   du libellé, fichier src/<hash>.monogram.png) : le sprite reste complet et
+   la page ne dépend d'aucun CDN. Le prochain lancement en ligne retente le
+   téléchargement et remplace le monogramme par le vrai logo.
+2. Assemble toutes les icônes dans une grille de cases Config.ICON_CELL px
+   (sprite.png) et écrit le manifeste sprite.json {URL d'origine: case}.
+
+L'application utilise ensuite le sprite à la place des URL distantes
+(voir icon_html dans app.py).
+
+Usage : python scripts/build_icons.py [--offline]
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import math
+import re
+import sys
+import urllib.request
+from pathlib import Path
+
+from PIL import Image, ImageDraw, ImageFont
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.append(str(BASE_DIR))
+
+from app import Config, load_profile_data, load_skills_data  # noqa: E402
+
+SOURCES_DIR = Config.ICONS_DIR / "src"
+# Les SVG de Wikimedia sont récupérés via leur miniature PNG (Pillow ne lit pas le SVG)
+WIKIMEDIA_SVG = re.compile(r"^https://upload\.wikimedia\.org/wikipedia/commons/(\w)/(\w\w)/([^/]+\.svg)$")
+
+
+def icon_urls():
+    """URL de logos utilisées par l'application -> libellé, dans un ordre stable"""
+    urls = {}
+    for name, skill in load_skills_data()["technical"].items():
+        if skill.get("logo"):
+            urls.setdefault(skill["logo"], name)
+    for item in load_profile_data()["social"].values():
+        if item.get("icon"):
+            urls.setdefault(item["icon"], item["name"])
+    return urls
+
+
+def fetch_url(url):
+    match = WIKIMEDIA_SVG.match(url)
+    if match:
+        a, ab, name = match.groups()
+        return f"https://upload.wikimedia.org/wikipedia/commons/thumb/{a}/{ab}/{name}/{Config.ICON_CELL * 2}px-{name}.png"
+    return url
+
+
+def vendored_path(url, suffix=".png"):
+    return SOURCES_DIR / f"{hashlib.sha256(url.encode()).hexdigest()[:16]}{suffix}"
+
+
+def monogram(url, label):
+    """Pastille aux initiales du libellé, lettres évidées (lisible aussi en silhouette)"""
+    path = vendored_path(url, ".monogram.png")
+    if path.exists():
+        return path
+    size = Config.ICON_CELL * 2
+    words = re.findall(r"[A-Za-z0-9]+", label) or ["?"]
+    if len(words) > 1:
+        letters = (words[0][0] + words[1][0]).upper()
+    else:
+        letters = words[0][:3] if words[0].isupper() else words[0][:2].title()  # SQL, AWS / Python
+    mask = Image.new("L", (size, size), 0)
+    draw = ImageDraw.Draw(mask)
+    draw.ellipse((0, 0, size - 1, size - 1), fill=255)
+    font = ImageFont.load_default(size=size * (0.45 if len(letters) < 3 else 0.34))
+    draw.text((size / 2, size / 2), letters, fill=0, font=font, anchor="mm")
+    badge = Image.new("RGBA", (size, size), Config.COLORS["accent"])
+    badge.putalpha(mask)
+    SOURCES_DIR.mkdir(parents=True, exist_ok=True)
+    badge.save(path, "PNG", optimize=True)
+    return path
+
+
+def vendor(url, offline):
+    """Copie locale (PNG) du logo, téléchargée si nécessaire"""
+    path = vendored_path(url)
+    if path.exists():
+        return path
+    if offline:
+        raise FileNotFoundError(f"{url} n'est pas encore téléchargé ({path})")
+    request = urllib.request.Request(fetch_url(url), headers={"User-Agent": "portfolio-build-icons"})
+    with urllib.request.urlopen(request, timeout=30) as response:
+        data = response.read()
+    image = Image.open(io.BytesIO(data))
+    SOURCES_DIR.mkdir(parents=True, exist_ok=True)
+    image.save(path, "PNG")
+    vendored_path(url, ".monogram.png").unlink(missing_ok=True)  # remplacé par le vrai logo
+    return path
+
+
+def pack(paths):
+    """Assemble les icônes (centrées, proportions conservées) dans une grille"""
+    cell = Config.ICON_CELL
+    columns = math.ceil(math.sqrt(len(paths)))
+    rows = math.ceil(len(paths) / columns)
+    sprite = Image.new("RGBA", (columns * cell, rows * cell), (0, 0, 0, 0))
+    for index, path in enumerate(paths):
+        icon = Image.open(path).convert("RGBA")
+        icon.thumbnail((cell, cell), Image.LANCZOS)
+        x = (index % columns) * cell + (cell - icon.width) // 2
+        y = (index // columns) * cell + (cell - icon.height) // 2
+        sprite.paste(icon, (x, y), icon)
+    return sprite, columns, rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--offline", action="store_true", help="n'utilise que les logos déjà téléchargés")
+    parser.add_argument("--no-monograms", action="store_true",
+                        help="ignore les logos indisponibles au lieu de les remplacer par un monogramme")
+    args = parser.parse_args()
+
+    urls, paths, monograms = [], [], []
+    for url, label in icon_urls().items():
+        try:
+            paths.append(vendor(url, args.offline))
+        except (OSError, ValueError) as exc:
+            if args.no_monograms:
+                print(f"ignoré : {url} ({exc})", file=sys.stderr)
+                continue
+            print(f"monogramme « {label} » : {url} ({exc})", file=sys.stderr)
+            paths.append(monogram(url, label))
+            monograms.append(url)
+        urls.append(url)
+    if not urls:
+        print("aucune icône disponible, sprite non généré", file=sys.stderr)
+        return 1
+
+    sprite, columns, rows = pack(paths)
+    sprite.save(Config.ICONS_DIR / "sprite.png", "PNG", optimize=True)
+    manifest = {
+        "sprite": "sprite.png",
+        "cell": Config.ICON_CELL,
+        "columns": columns,
+        "rows": rows,
+        "icons": {url: index for index, url in enumerate(urls)},
+        "monograms": monograms,
+    }
+    (Config.ICONS_DIR / "sprite.json").write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+    print(f"{len(urls)} icônes dont {len(monograms)} monogramme(s) -> {Config.ICONS_DIR / 'sprite.png'} ({columns}x{rows})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,185 @@
+"""
+Vérifie les backends de cache partagé (DiskCacheBackend, RedisCacheBackend).
+
+- calcul unique (single-flight) : N processus (disque) ou threads (Redis)
+  demandent la même clé manquante ; un seul calcule, tous reçoivent la
+  même valeur ;
+- verrou : expiration après son TTL, libération réservée à son détenteur ;
+- éviction LRU du backend disque : dépassement de max_bytes -> l'entrée la
+  moins récemment lue est supprimée, jamais celle qui vient d'être écrite ;
+- panne du backend : la valeur est calculée localement, les erreurs du
+  calcul lui-même remontent.
+
+Redis : serveur réel avec --redis-url, sinon fakeredis[lua] s'il est
+installé (la libération du verrou est un script Lua), sinon la vérification
+est ignorée. Sort avec le code 1 au premier échec.
+
+Usage : python scripts/check_shared_cache.py [--processes 8] [--redis-url redis://localhost:6379/15]
+"""
+
+import argparse
+import importlib
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+
+import streamlit.logger
+
+# Appels hors d'une session Streamlit et pannes simulées : avertissements attendus, rendus muets
+streamlit.logger.set_log_level("error")
+logging.getLogger("portfolio.cache").setLevel(logging.ERROR)
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.append(str(BASE_DIR))
+
+from app import CacheBackend, DiskCacheBackend, RedisCacheBackend  # noqa: E402
+
+KEY = "check:single-flight"
+COMPUTE_SECONDS = 0.5
+
+
+def slow_compute(calls_file):
+    """Calcul lent qui consigne chacun de ses appels (une ligne par appel)"""
+    def compute():
+        with open(calls_file, "a") as calls:
+            calls.write(f"{os.getpid()}:{threading.get_ident()}\n")
+        time.sleep(COMPUTE_SECONDS)
+        return b"value"
+    return compute
+
+
+def disk_worker(db_path, calls_file, start_at):
+    backend = DiskCacheBackend(Path(db_path), 1 << 20)
+    time.sleep(max(0.0, start_at - time.time()))  # départ simultané
+    return backend.get_or_compute(KEY, slow_compute(calls_file))
+
+
+def check(condition, message):
+    print(f"{'OK   ' if condition else 'ÉCHEC'} {message}")
+    if not condition:
+        raise SystemExit(1)
+
+
+def check_single_flight(results, calls_file, racers):
+    calls = Path(calls_file).read_text().splitlines()
+    check(len(calls) == 1, f"single-flight : {len(calls)} calcul(s) pour {racers} demandeurs")
+    check(set(results) == {b"value"}, "single-flight : tous les demandeurs reçoivent la valeur calculée")
+
+
+def check_lock(backend):
+    check(backend.acquire("lock-check", "a", 0.2), "verrou : acquis par un premier détenteur")
+    check(not backend.acquire("lock-check", "b", 0.2), "verrou : refusé à un second tant qu'il est valide")
+    time.sleep(0.3)
+    check(backend.acquire("lock-check", "b", 5), "verrou : repris après expiration du TTL")
+    backend.release("lock-check", "a")
+    check(not backend.acquire("lock-check", "c", 5), "verrou : l'ancien détenteur ne libère pas le verrou repris")
+    backend.release("lock-check", "b")
+    check(backend.acquire("lock-check", "c", 5), "verrou : libéré par son détenteur")
+    backend.release("lock-check", "c")
+
+
+def check_disk(workdir, processes):
+    db_path, calls_file = workdir / "shared.sqlite", workdir / "disk-calls.txt"
+    calls_file.touch()
+    DiskCacheBackend(db_path, 1 << 20)  # schéma créé avant la course
+    start_at = time.time() + 1.0
+    with ProcessPoolExecutor(max_workers=processes, mp_context=get_context("spawn")) as pool:
+        futures = [pool.submit(disk_worker, str(db_path), str(calls_file), start_at) for _ in range(processes)]
+        results = [future.result() for future in futures]
+    check_single_flight(results, calls_file, processes)
+
+    backend = DiskCacheBackend(workdir / "lru.sqlite", 300)
+    check_lock(backend)
+    for key in ("a", "b", "c"):
+        backend.set(key, b"x" * 100)
+        time.sleep(0.01)
+    backend.get("a")  # "b" devient la moins récemment utilisée
+    time.sleep(0.01)
+    backend.set("d", b"x" * 100)
+    kept = {key for key in "abcd" if backend.get(key) is not None}
+    check(kept == {"a", "c", "d"}, f"LRU disque : {sorted(kept)} conservées (attendu : b, la moins récente, évincée)")
+    backend.set("big", b"x" * 1000)
+    check(backend.get("big") is not None, "LRU disque : une entrée plus grande que max_bytes n'est pas évincée à l'écriture")
+
+
+class BrokenBackend(CacheBackend):
+    """Backend dont chaque appel échoue (serveur injoignable)"""
+
+    def get(self, key):
+        raise ConnectionError("backend injoignable")
+
+    set = acquire = release = get
+
+
+def check_fail_open():
+    backend = BrokenBackend()
+    check(backend.get_or_compute(KEY, lambda: b"local") == b"local", "panne : valeur calculée localement")
+
+    def failing():
+        raise ValueError("calcul en échec")
+
+    try:
+        backend.get_or_compute(KEY, failing)
+    except ValueError:
+        raised = True
+    else:
+        raised = False
+    check(raised, "panne : l'erreur du calcul remonte telle quelle")
+
+
+def redis_client(url):
+    if url:
+        client = importlib.import_module("redis").Redis.from_url(url)
+        client.flushdb()
+        return client
+    try:
+        fakeredis = importlib.import_module("fakeredis")
+        importlib.import_module("lupa")
+    except ImportError:
+        return None
+    return fakeredis.FakeStrictRedis(server=fakeredis.FakeServer())
+
+
+def check_redis(workdir, url, racers):
+    client = redis_client(url)
+    if client is None:
+        print("ignoré Redis : ni --redis-url ni fakeredis[lua]")
+        return
+    backend = RedisCacheBackend(client, 1 << 20, prefix="portfolio-check:")
+    calls_file = workdir / "redis-calls.txt"
+    calls_file.touch()
+    barrier = threading.Barrier(racers)
+
+    def race(_):
+        barrier.wait()
+        return backend.get_or_compute(KEY, slow_compute(calls_file))
+
+    with ThreadPoolExecutor(max_workers=racers) as pool:
+        results = list(pool.map(race, range(racers)))
+    check_single_flight(results, calls_file, racers)
+    check_lock(backend)
+    backend.set("too-big", b"x" * (2 << 20))
+    check(backend.get("too-big") is None, "Redis : valeur au-delà de max_value_bytes non stockée")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--processes", type=int, default=8, help="processus (disque) ou threads (Redis) en concurrence")
+    parser.add_argument("--redis-url", help="serveur Redis de test (base vidée !)")
+    args = parser.parse_args()
+
+    check_fail_open()
+    with tempfile.TemporaryDirectory() as tmp:
+        check_disk(Path(tmp), args.processes)
+        check_redis(Path(tmp), args.redis_url, args.processes)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
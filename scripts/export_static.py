@@ -0,0 +1,195 @@
+"""
+Export statique du portfolio, servable par n'importe quel serveur de fichiers ou CDN.
+
+Réutilise les chargeurs de données et les constructeurs HTML de app.py pour
+produire une page unique (une ancre par section : index.html#projects), une
+feuille de style minifiée et les assets référencés, tous nommés d'après le
+hash de leur contenu. Les fichiers texte sont accompagnés de versions .gz/.br.
+
+Restent réservés à l'application Streamlit : la recherche et les graphiques
+Plotly de WHAT I DO (radar, niveaux, années de pratique), qui demandent le
+runtime JavaScript de Plotly ; la section n'exporte que les cartes de
+compétences.
+
+Usage : python scripts/export_static.py [--out dist]
+"""
+
+import argparse
+import re
+import shutil
+import sys
+from datetime import datetime
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.append(str(BASE_DIR))
+
+from app import (  # noqa: E402
+    SECTIONS,
+    Config,
+    background_css,
+    build_contact_card,
+    build_experience_html,
+    build_footer_html,
+    build_profile_header,
+    build_research_html,
+    build_skill_category_card,
+    build_stat_cards,
+    content_hash,
+    group_skills,
+    hex_to_rgba,
+    load_experience_data,
+    load_profile_data,
+    load_projects_data,
+    load_research_data,
+    load_skills_data,
+    minify_css,
+    precompress,
+    resolve_asset,
+    responsive_image_html,
+    section_title,
+    theme_css,
+)
+
+def layout_css():
+    """Mise en page remplaçant les colonnes et la navigation de Streamlit (palette de Config.COLORS)"""
+    c = Config.COLORS
+    return f"""
+    body {{ margin: 0; font-family: "Source Sans Pro", sans-serif; background: {c['dark']}; color: {c['light']}; }}
+    .page {{ max-width: 1200px; margin: 0 auto; padding: 40px 20px; }}
+    nav {{ display: flex; justify-content: center; flex-wrap: wrap; gap: 25px; margin-bottom: 30px; }}
+    nav a {{ color: {c['light']}; font-weight: 600; text-decoration: none; }}
+    nav a:hover {{ color: {c['accent']}; }}
+    main > section {{ display: none; }}
+    main > section:target, main:not(:has(section:target)) > #about {{ display: block; }}
+    .cols {{ display: flex; flex-wrap: wrap; gap: 30px; }}
+    .cols > .col-1 {{ flex: 1; min-width: 220px; }}
+    .cols > .col-2 {{ flex: 2; min-width: 300px; }}
+    .grid-2 {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(320px, 1fr)); gap: 0 20px; }}
+    .grid-4 {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(140px, 1fr)); gap: 15px; }}
+    details.project {{ background: {hex_to_rgba(c['panel'], 0.8)}; border-radius: 10px; padding: 15px 20px; margin-bottom: 10px; }}
+    details.project summary {{ cursor: pointer; font-weight: 600; }}
+    details.project a {{ color: {c['accent']}; }}
+    """
+
+def about_html():
+    profile = load_profile_data()
+    personal = profile["personal"]
+    photo = resolve_asset(personal["photo"])
+    photo_html = responsive_image_html(photo, Config.PROFILE_PHOTO_WIDTH, "pf-photo") if photo.exists() else ""
+    return (
+        f'<div class="cols"><div class="col-1">{photo_html}{build_contact_card(personal)}</div>'
+        f'<div class="col-2">{build_profile_header(personal)}'
+        '<h3 class="pf-subtitle">📈 Mes Statistiques Data Science</h3>'
+        f'<div class="grid-4">{"".join(build_stat_cards(profile["stats"]))}</div></div></div>'
+    )
+
+
+def what_i_do_html():
+    categories = group_skills(load_skills_data()["technical"])
+    cards = "".join(build_skill_category_card(category, skills) for category, skills in categories.items())
+    return f'{section_title("what-i-do")}<div class="grid-2">{cards}</div>'
+
+
+def experience_html():
+    return section_title("experience") + build_experience_html(load_experience_data())
+
+
+def projects_html():
+    items = []
+    for project in load_projects_data():
+        items.append(
+            f'<details class="project"><summary>{project["title"]} - {project["category"]}</summary>'
+            f'<p>{project["description"]}</p>'
+            f'<p><strong>Technologies:</strong> {", ".join(project["technologies"])}</p>'
+            f'<a href="{project["github"]}" target="_blank">GitHub</a></details>'
+        )
+    return section_title("projects") + "".join(items)
+
+
+def research_html():
+    return section_title("research") + build_research_html(load_research_data())
+
+
+# slug de SECTIONS -> constructeur statique (ni la recherche ni les graphiques de WHAT I DO)
+BUILDERS = {
+    "about": about_html,
+    "what-i-do": what_i_do_html,
+    "experience": experience_html,
+    "projects": projects_html,
+    "research": research_html,
+}
+
+
+def minify_html(html):
+    return re.sub(r">\s+<", "><", re.sub(r"\s+", " ", html)).strip()
+
+
+def style_contents(block):
+    """Contenu des balises <style> d'un bloc HTML"""
+    return "".join(re.findall(r"<style>(.*?)</style>", block, flags=re.S))
+
+
+def render_page(stylesheet):
+    nav = "".join(f'<a href="#{slug}">{SECTIONS[slug][0]}</a>' for slug in BUILDERS)
+    sections = "".join(f'<section id="{slug}">{build()}</section>' for slug, build in BUILDERS.items())
+    footer = build_footer_html(load_profile_data()["social"], datetime.now().year)
+    return minify_html(f"""<!DOCTYPE html>
+    <html lang="fr"><head><meta charset="utf-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1">
+    <title>{Config.PAGE_TITLE}</title>
+    <link rel="stylesheet" href="{stylesheet}">
+    </head><body><div class="stApp"><div class="page">
+    <div class="main-title">MY PORTFOLIO</div>
+    <div class="main-subtitle">Data Science • Machine Learning • Artificial Intelligence</div>
+    <nav>{nav}</nav><main>{sections}</main>{footer}
+    </div></div></body></html>""")
+
+
+def export(out):
+    """Écrit le site dans `out` et renvoie la liste des fichiers produits"""
+    # Les URL générées par app.py deviennent relatives à la racine du site
+    Config.STATIC_SERVING = True
+    Config.STATIC_URL = "static"
+
+    css = layout_css() + theme_css()
+    if Config.BACKGROUND_IMAGE.exists():
+        css += style_contents(background_css(Config.BACKGROUND_IMAGE.stat().st_mtime_ns))
+    css = minify_css(css)
+    # Feuille écrite à côté de index.html : ses url("static/...") se résolvent
+    # par rapport à elle, comme les src de la page
+    stylesheet = f"style-{content_hash(css.encode())}.css"
+    html = render_page(stylesheet)
+
+    static_out = out / "static"
+    static_out.mkdir(parents=True, exist_ok=True)
+    written = [out / stylesheet, out / "index.html"]
+    written[0].write_text(css, encoding="utf-8")
+    written[1].write_text(html, encoding="utf-8")
+    for name in sorted(set(re.findall(r'static/([\w.-]+)', html + css))):
+        shutil.copyfile(Config.STATIC_DIR / name, static_out / name)
+        written.append(static_out / name)
+
+    # Fichiers versionnés : cache immuable ; index.html toujours revalidé
+    headers = out / "_headers"
+    headers.write_text("/static/*\n  Cache-Control: public, max-age=31536000, immutable\n"
+                       "/style-*\n  Cache-Control: public, max-age=31536000, immutable\n"
+                       "/index.html\n  Cache-Control: no-cache\n")
+    for path in list(written):
+        if path.suffix in Config.STATIC_COMPRESSIBLE:
+            written += precompress(path)
+    return written + [headers]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--out", type=Path, default=BASE_DIR / "dist", help="dossier de sortie")
+    args = parser.parse_args()
+    written = export(args.out)
+    total = sum(path.stat().st_size for path in written)
+    print(f"{len(written)} fichiers écrits dans {args.out} ({total / 1024:.0f} Ko)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
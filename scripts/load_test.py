@@ -0,0 +1,200 @@
+"""
+Test de charge : visiteurs simultanés sur une instance de app.py.
+
+Pour chaque palier de concurrence (--levels 1,4,8,16), le script démarre un
+serveur `streamlit run app.py` local et neuf, puis y connecte autant de
+visiteurs asyncio qu'indiqué. Chaque visiteur parle le protocole du
+navigateur (websocket /_stcore/stream, messages BackMsg/ForwardMsg) :
+il arrive sur une section, puis change d'onglet selon des poids réalistes,
+lance parfois une recherche, avec un temps de réflexion entre deux actions.
+
+Rapport par palier : débit (reruns/s), latence p50/p95/p99 d'un rerun
+(envoi du BackMsg -> script_finished), erreurs (exceptions affichées ou
+scripts interrompus), RSS du serveur au départ, à la fin et au pic
+(/proc/<pid>/status). Aucun accès réseau : tout tourne sur 127.0.0.1.
+
+Usage :
+    python scripts/load_test.py [--levels 1,4,8,16] [--steps 10] [--think-ms 200] [--json rapport.json]
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+from contextlib import contextmanager
+from pathlib import Path
+
+import websockets
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.append(str(BASE_DIR))
+
+from app import SECTIONS  # noqa: E402
+
+# Fréquence relative des onglets visités (accueil et projets en tête)
+SECTION_WEIGHTS = {"about": 3, "what-i-do": 2, "experience": 2, "projects": 3, "research": 2, "search": 1}
+SEARCH_QUERIES = ["LLM", "Markov", "Docker", "machine learning", "finance", "python"]
+# script_finished : seuls ces statuts correspondent à un rerun mené à terme
+FINISHED_OK = {ForwardMsg.FINISHED_SUCCESSFULLY, ForwardMsg.FINISHED_FRAGMENT_RUN_SUCCESSFULLY}
+
+
+def proc_status_kb(pid, field):
+    """Champ mémoire (VmRSS, VmHWM...) de /proc/<pid>/status, en Ko"""
+    for line in Path(f"/proc/{pid}/status").read_text().splitlines():
+        if line.startswith(f"{field}:"):
+            return int(line.split()[1])
+    return 0
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@contextmanager
+def streamlit_server():
+    """Serveur Streamlit local et neuf ; renvoie (process, port) une fois prêt"""
+    port = free_port()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", "app.py", "--server.headless=true",
+         "--server.address=127.0.0.1", f"--server.port={port}",
+         "--server.fileWatcherType=none", "--browser.gatherUsageStats=false"],
+        cwd=BASE_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        deadline = time.monotonic() + 60
+        while True:
+            try:
+                urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1)
+                break
+            except OSError:
+                if process.poll() is not None or time.monotonic() > deadline:
+                    raise RuntimeError("le serveur Streamlit n'a pas démarré")
+                time.sleep(0.2)
+        yield process, port
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
+
+
+class Visitor:
+    """Session navigateur minimale : envoie des reruns et attend leur fin"""
+
+    def __init__(self, ws):
+        self.ws = ws
+        self.widgets = {}  # type d'élément -> id du widget (radio de navigation, recherche)
+        self.latencies = []
+        self.errors = 0
+
+    async def rerun(self, query_string="", states=()):
+        message = BackMsg()
+        message.rerun_script.query_string = query_string
+        message.rerun_script.widget_states.widgets.extend(states)
+        start = time.perf_counter()
+        await self.ws.send(message.SerializeToString())
+        while True:
+            forward = ForwardMsg()
+            forward.ParseFromString(await self.ws.recv())
+            kind = forward.WhichOneof("type")
+            if kind == "delta" and forward.delta.WhichOneof("type") == "new_element":
+                element = forward.delta.new_element
+                element_type = element.WhichOneof("type")
+                if element_type == "exception":
+                    self.errors += 1
+                elif element_type in ("radio", "text_input"):
+                    self.widgets[element_type] = getattr(element, element_type).id
+            elif kind == "script_finished":
+                self.latencies.append((time.perf_counter() - start) * 1000)
+                self.errors += forward.script_finished not in FINISHED_OK
+                return
+
+    def state(self, element_type, value):
+        """État de widget tel que l'envoie le navigateur (valeurs texte)"""
+        widget = WidgetState(id=self.widgets[element_type])
+        widget.string_value = value
+        return widget
+
+
+async def visit(port, seed, steps, think_ms):
+    """Un visiteur : arrivée sur une section puis `steps` changements d'onglet"""
+    rng = random.Random(seed)
+    slugs = [slug for slug in SECTION_WEIGHTS if slug in SECTIONS]
+    section = rng.choices(slugs, [SECTION_WEIGHTS[slug] for slug in slugs])[0]
+
+    async with websockets.connect(f"ws://127.0.0.1:{port}/_stcore/stream",
+                                  subprotocols=["streamlit"], max_size=None) as ws:
+        visitor = Visitor(ws)
+        await visitor.rerun(f"section={section}")
+        for _ in range(steps):
+            await asyncio.sleep(rng.uniform(0, think_ms) / 1000)
+            others = [slug for slug in slugs if slug != section]
+            section = rng.choices(others, [SECTION_WEIGHTS[slug] for slug in others])[0]
+            # Le radio est transmis par son libellé affiché, comme le fait le navigateur
+            nav = visitor.state("radio", SECTIONS[section][0])
+            await visitor.rerun(states=[nav])
+            if section == "search" and "text_input" in visitor.widgets:
+                await asyncio.sleep(rng.uniform(0, think_ms) / 1000)
+                await visitor.rerun(states=[nav, visitor.state("text_input", rng.choice(SEARCH_QUERIES))])
+        return visitor
+
+
+async def run_level(port, pid, concurrency, steps, think_ms, seed):
+    """Un palier : `concurrency` visiteurs simultanés sur le même serveur"""
+    rss_start = proc_status_kb(pid, "VmRSS")
+    start = time.perf_counter()
+    visitors = await asyncio.gather(*(visit(port, seed + i, steps, think_ms) for i in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    latencies = sorted(ms for visitor in visitors for ms in visitor.latencies)
+    percentiles = statistics.quantiles(latencies, n=100, method="inclusive") if len(latencies) > 1 else latencies * 99
+    return {
+        "concurrency": concurrency,
+        "reruns": len(latencies),
+        "errors": sum(visitor.errors for visitor in visitors),
+        "throughput_rps": len(latencies) / elapsed,
+        "p50_ms": percentiles[49],
+        "p95_ms": percentiles[94],
+        "p99_ms": percentiles[98],
+        "rss_start_kb": rss_start,
+        "rss_end_kb": proc_status_kb(pid, "VmRSS"),
+        "rss_peak_kb": proc_status_kb(pid, "VmHWM"),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--levels", default="1,4,8,16", help="nombres de visiteurs simultanés, séparés par des virgules")
+    parser.add_argument("--steps", type=int, default=10, help="changements d'onglet par visiteur")
+    parser.add_argument("--think-ms", type=float, default=200, help="temps de réflexion maximal entre deux actions")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", type=Path, help="écrit le rapport dans ce fichier")
+    args = parser.parse_args()
+
+    levels = []
+    print(f"{'visiteurs':>9} {'reruns':>7} {'err':>4} {'rerun/s':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'RSS +Mo':>8} {'pic Mo':>7}")
+    for concurrency in (int(level) for level in args.levels.split(",")):
+        # Serveur neuf par palier : caches froids et RSS de départ comparables
+        with streamlit_server() as (process, port):
+            level = asyncio.run(run_level(port, process.pid, concurrency, args.steps, args.think_ms, args.seed))
+        levels.append(level)
+        growth_mb = (level["rss_end_kb"] - level["rss_start_kb"]) / 1024
+        print(f"{concurrency:>9} {level['reruns']:>7} {level['errors']:>4} {level['throughput_rps']:>8.1f} "
+              f"{level['p50_ms']:>6.0f}ms {level['p95_ms']:>6.0f}ms {level['p99_ms']:>6.0f}ms "
+              f"{growth_mb:>8.1f} {level['rss_peak_kb'] / 1024:>7.0f}")
+
+    if args.json:
+        args.json.write_text(json.dumps({"steps": args.steps, "think_ms": args.think_ms, "levels": levels}, indent=2) + "\n")
+    return 1 if any(level["errors"] for level in levels) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
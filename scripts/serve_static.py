@@ -0,0 +1,173 @@
+"""
+Serveur compagnon des fichiers statiques du portfolio (Config.STATIC_DIR).
+
+- Négocie Accept-Encoding et renvoie les variantes pré-compressées .br/.gz
+  produites par write_static / scripts/build_assets.py (jamais de compression
+  à la volée).
+- ETag par représentation, dérivé du contenu (identique d'un réplica ou
+  d'un déploiement à l'autre), et réponse 304 sur If-None-Match.
+- Fichiers versionnés (nom contenant le hash du contenu) : cache public
+  immuable d'un an ; les autres sont revalidés à chaque fois.
+- /metrics : fusion des fichiers Prometheus écrits par chaque processus de
+  l'application (Config.METRICS_FILE, un fichier par pid), s'il est configuré.
+
+L'application pointe vers ce serveur avec PORTFOLIO_STATIC_URL :
+    python scripts/serve_static.py --port 8502
+    PORTFOLIO_STATIC_URL=http://localhost:8502 streamlit run app.py
+
+Usage : python scripts/serve_static.py [--host 127.0.0.1] [--port 8502]
+"""
+
+import argparse
+import functools
+import mimetypes
+import re
+import sys
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import unquote, urlsplit
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.append(str(BASE_DIR))
+
+from app import Config, content_hash  # noqa: E402
+
+# Noms produits par app.py : theme-<hash>.css, bg-<hash>-960.webp, photo-<hash>-200.webp...
+VERSIONED_NAME = re.compile(r"-[0-9a-f]{12}[-.]")
+IMMUTABLE = "public, max-age=31536000, immutable"
+# Variantes dans l'ordre de préférence : suffixe du fichier -> Content-Encoding
+ENCODINGS = ((".br", "br"), (".gz", "gzip"))
+
+
+def process_metrics_files():
+    """Fichiers <nom>.<pid><suffixe> écrits par les processus de l'application (cf. app.metrics_file)"""
+    path = Path(Config.METRICS_FILE)
+    pattern = re.compile(rf"{re.escape(path.stem)}\.\d+{re.escape(path.suffix)}")
+    return sorted(p for p in path.parent.glob(f"{path.stem}.*") if pattern.fullmatch(p.name))
+
+
+def merge_metrics(paths):
+    """Concatène les expositions Prometheus : une ligne # TYPE et un seul groupe d'échantillons par métrique"""
+    families = {}
+    current = None
+    for path in paths:
+        try:
+            text = path.read_text()
+        except FileNotFoundError:
+            continue  # processus arrêté entre-temps
+        for line in text.splitlines():
+            if line.startswith("# TYPE "):
+                current = families.setdefault(line, [])
+            elif line and current is not None:
+                current.append(line)
+    return "".join(f"{type_line}\n" + "".join(f"{sample}\n" for sample in samples)
+                   for type_line, samples in families.items())
+
+
+@functools.lru_cache(maxsize=1024)
+def file_hash(path, mtime_ns, size):
+    """Hash du contenu, recalculé seulement si le fichier change (mtime, taille)"""
+    return content_hash(Path(path).read_bytes())
+
+
+def accepted_encodings(header):
+    """Codages acceptés par le client (ceux marqués q=0 sont exclus)"""
+    accepted = set()
+    for part in header.split(","):
+        coding, _, params = part.strip().partition(";")
+        if coding and not re.fullmatch(r"\s*q=0(\.0*)?\s*", params):
+            accepted.add(coding.strip().lower())
+    return accepted
+
+
+class StaticHandler(BaseHTTPRequestHandler):
+    root = Config.STATIC_DIR
+    server_version = "portfolio-static"
+
+    def do_HEAD(self):
+        self.respond(send_body=False)
+
+    def do_GET(self):
+        self.respond(send_body=True)
+
+    def respond(self, send_body):
+        path = unquote(urlsplit(self.path).path)
+        if path == "/metrics":
+            return self.send_metrics(send_body)
+        target = self.resolve(path.lstrip("/"))
+        if target is None:
+            return self.send_error(HTTPStatus.NOT_FOUND)
+
+        accepted = accepted_encodings(self.headers.get("Accept-Encoding", ""))
+        body_path, encoding = target, None
+        for suffix, coding in ENCODINGS:
+            variant = target.with_name(target.name + suffix)
+            if coding in accepted and variant.is_file():
+                body_path, encoding = variant, coding
+                break
+
+        stat = body_path.stat()
+        etag = f'"{file_hash(str(body_path), stat.st_mtime_ns, stat.st_size)}"'
+        cache_control = IMMUTABLE if VERSIONED_NAME.search(target.name) else "no-cache"
+        if etag in (tag.strip() for tag in self.headers.get("If-None-Match", "").split(",")):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_caching_headers(etag, cache_control)
+            return self.end_headers()
+
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", mimetypes.guess_type(target.name)[0] or "application/octet-stream")
+        self.send_header("Content-Length", str(stat.st_size))
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        self.send_caching_headers(etag, cache_control)
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body_path.read_bytes())
+
+    def send_caching_headers(self, etag, cache_control):
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", cache_control)
+        self.send_header("Vary", "Accept-Encoding")
+        self.send_header("Access-Control-Allow-Origin", "*")
+
+    def resolve(self, name):
+        """Fichier demandé, s'il existe dans root (pas de fichiers cachés ni de sortie du dossier)"""
+        if not name or name.startswith(".") or "/" in name or "\\" in name:
+            return None
+        target = self.root / name
+        return target if target.is_file() else None
+
+    def send_metrics(self, send_body):
+        paths = process_metrics_files() if Config.METRICS_FILE else []
+        if not paths:
+            return self.send_error(HTTPStatus.NOT_FOUND)
+        body = merge_metrics(paths).encode()
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "text/plain; version=0.0.4")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8502)
+    parser.add_argument("--root", type=Path, default=Config.STATIC_DIR, help="dossier servi")
+    args = parser.parse_args()
+
+    StaticHandler.root = args.root
+    server = ThreadingHTTPServer((args.host, args.port), StaticHandler)
+    print(f"{args.root} servi sur http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,100 @@
+"""
+Benchmark de démarrage du portfolio.
+
+Mesure, dans des interpréteurs neufs :
+- le temps d'import de app.py (python -X importtime) et les modules les plus lents ;
+- le temps jusqu'au premier rendu complet (AppTest headless, processus complet).
+
+Sort avec le code 1 si un budget (Config.IMPORT_BUDGET_MS,
+Config.FIRST_RENDER_BUDGET_MS) est dépassé.
+
+Usage : python scripts/startup_bench.py [--runs 3] [--json rapport.json]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.append(str(BASE_DIR))
+
+from app import Config  # noqa: E402
+
+FIRST_RENDER_SCRIPT = """
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file("app.py", default_timeout=120)
+at.run()
+if at.exception:
+    raise SystemExit(at.exception[0].message)
+"""
+
+
+def measure_imports():
+    """Temps d'import de app.py (ms) et les 10 modules au coût cumulé le plus élevé"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app"],
+        cwd=BASE_DIR, capture_output=True, text=True, check=True,
+    )
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        modules.append((name.strip(), int(cumulative) / 1000))
+    total = next(ms for name, ms in reversed(modules) if name == "app")
+    top = sorted((m for m in modules if m[0] != "app"), key=lambda m: m[1], reverse=True)[:10]
+    return total, top
+
+
+def measure_first_render():
+    """Durée (ms) d'un processus neuf jusqu'à la fin du premier rendu"""
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", FIRST_RENDER_SCRIPT], cwd=BASE_DIR, capture_output=True, check=True)
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=3, help="nombre de mesures (médiane retenue)")
+    parser.add_argument("--import-budget", type=float, default=Config.IMPORT_BUDGET_MS)
+    parser.add_argument("--render-budget", type=float, default=Config.FIRST_RENDER_BUDGET_MS)
+    parser.add_argument("--json", type=Path, help="écrit le rapport dans ce fichier")
+    args = parser.parse_args()
+
+    imports = [measure_imports() for _ in range(args.runs)]
+    import_ms = statistics.median(total for total, _ in imports)
+    render_ms = statistics.median(measure_first_render() for _ in range(args.runs))
+
+    print(f"import app           : {import_ms:8.1f} ms (budget {args.import_budget:.0f} ms)")
+    print(f"time-to-first-render : {render_ms:8.1f} ms (budget {args.render_budget:.0f} ms)")
+    print("modules les plus lents :")
+    for name, ms in imports[-1][1]:
+        print(f"  {ms:8.1f} ms  {name}")
+
+    failures = []
+    if import_ms > args.import_budget:
+        failures.append("import")
+    if render_ms > args.render_budget:
+        failures.append("first_render")
+
+    if args.json:
+        args.json.write_text(json.dumps({
+            "import_ms": import_ms,
+            "first_render_ms": render_ms,
+            "budgets": {"import_ms": args.import_budget, "first_render_ms": args.render_budget},
+            "slowest_imports": imports[-1][1],
+            "failures": failures,
+        }, indent=2))
+
+    if failures:
+        print(f"ÉCHEC : budget dépassé ({', '.join(failures)})")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())